@@ -1,14 +1,41 @@
 #!/usr/bin/env python3
 # coding: utf-8
 import math
+from bisect import bisect_left, bisect_right
 from functools import reduce
 
-from util import UniqueList, float_close, float_gt, float_lt
+from util import ABS_TOL, UniqueList, float_close, float_gt, float_lt
 
 
 π = math.pi
 TWOπ = 2 * π
 
+# Polygons with at least this many edges index their edges for point and line
+# queries (see _ring_index and _edge_tree).  Below this, scanning every edge is
+# just as quick.
+INDEX_MIN_EDGES = 16
+
+# The maximum number of children for each node in an _edge_tree.
+TREE_NODE_SIZE = 8
+
+# Exact (sine, cosine) pairs for the angles in the first half turn that are
+# multiples of 30° or 45°, keyed by the angle in 24ths of a turn.  math.sin and
+# math.cos are a rounding error out for most of these, which would spoil the
+# symmetry of regular polygons.
+_HALF_ROOT3 = math.sqrt(3) / 2
+_HALF_ROOT2 = math.sqrt(0.5)
+EXACT_SIN_COS = {
+        0: (0.0, 1.0),
+        2: (0.5, _HALF_ROOT3),
+        3: (_HALF_ROOT2, _HALF_ROOT2),
+        4: (_HALF_ROOT3, 0.5),
+        6: (1.0, 0.0),
+        8: (_HALF_ROOT3, -0.5),
+        9: (_HALF_ROOT2, -_HALF_ROOT2),
+        10: (0.5, -_HALF_ROOT3),
+        12: (0.0, -1.0),
+        }
+
 
 class Plot():
     def __init__(self):
@@ -120,9 +147,7 @@ class Collection(Geometry):
     __slots__ = ['items']
 
     def __init__(self, items=None):
-        self.items = set()
-        if items:
-            self.items = set(tuple(items))
+        self.items = set(items) if items else set()
 
     @property
     def base(self):
@@ -132,7 +157,7 @@ class Collection(Geometry):
         member as a single geometry.  Otherwise, it is the entire collection.
         """
         if len(self) == 1:
-            return tuple(self.items)[0]
+            return next(iter(self.items))
         return self
 
     def __len__(self):
@@ -187,14 +212,14 @@ class Collection(Geometry):
             else:
                 unnested.append(item)
 
-        if all([isinstance(x, Polygon) for x in unnested]):
+        if all(isinstance(x, Polygon) for x in unnested):
             cls = MultiPolygon
-        elif all([isinstance(x, Line) for x in unnested]):
+        elif all(isinstance(x, Line) for x in unnested):
             cls = MultiLine
-        elif all([isinstance(x, Point) for x in unnested]):
+        elif all(isinstance(x, Point) for x in unnested):
             cls = MultiPoint
 
-        return cls(items)
+        return cls(unnested)
 
     @property
     def bbox(self):
@@ -226,7 +251,7 @@ class Collection(Geometry):
         if not self.bbox.intersects(other):
             return False
 
-        return any([x.intersects(other) for x in self.items])
+        return any(x.intersects(other) for x in self.items)
 
     def disjoint(self, other):
         return not self.intersects(other)
@@ -273,13 +298,11 @@ class Point(Geometry):
         according to normal Python semantics.  The 'equals' method, on the
         other hand, behaves as per the DE-9IM spatial predicate function.
         """
-        if other is None:
-            return False
-        if isinstance(other, (Line, Shape)):
-            return False
         if not isinstance(other, Point):
+            if other is None or isinstance(other, (Line, Shape)):
+                return False
             other = Point(other)
-        return self.as_tuple() == other.as_tuple()
+        return (self.x, self.y) == (other.x, other.y)
 
     def close(self, other):
         """Return whether this point is 'close' to another.
@@ -379,7 +402,7 @@ class Point(Geometry):
             return self.equals(other.a) or self.equals(other.b)
 
         if isinstance(other, Polygon):
-            return any([self.intersects(x) for x in other.lines])
+            return any(self.intersects(x) for x in other.lines)
 
         return other.touches(self)
 
@@ -430,12 +453,7 @@ class Point(Geometry):
                     and not self.equals(other.b))
 
         if isinstance(other, Polygon):
-            if self.disjoint(other):
-                return False
-            for line in other.lines:
-                if self.intersects(line):
-                    return False
-            return True
+            return other.contains_point(self)
 
         return other.contains(self)
 
@@ -490,34 +508,54 @@ class Line(Geometry):
     themselves.
 
     A Line has a direction -- it begins at point A and ends at point B.
+
+    Since lines are used heavily in the spatial predicates, some properties of
+    the line's direction are calculated once up front and stored as plain
+    attributes:
+
+    - dx: the difference in x-value between the end points
+    - dy: the difference in y-value between the end points
+    - angle: the size of the angle between the line and the positive X axis,
+      as a number of radians between π and -π.  A positive angle means the
+      line heads "above" the X axis, in the positive Y direction.  A negative
+      angle means the line heads "below" the X axis, in the negative Y
+      direction.
     """
-    __slots__ = ['a', 'b']
+    __slots__ = ['a', 'b', 'dx', 'dy', '_angle']
     DIMENSION = 1
 
     def __init__(self, a, b):
-        self.a = Point(a)
-        self.b = Point(b)
-
-        if self.a.equals(b):
+        # Points are never modified once built, so any given as Points can be
+        # shared rather than copied.
+        a = a if isinstance(a, Point) else Point(a)
+        b = b if isinstance(b, Point) else Point(b)
+        if float_close(a.x, b.x) and float_close(a.y, b.y):
             raise ValueError("Invalid line: the two points are too close.")
 
-    @property
-    def is_horizontal(self):
-        return self.a.y == self.b.y
+        self.a = a
+        self.b = b
+        self.dx = b.x - a.x
+        self.dy = b.y - a.y
+        self._angle = None
 
     @property
-    def is_vertical(self):
-        return self.a.x == self.b.x
+    def angle(self):
+        """Return the direction of this line in radians, from -π to π.
+
+        The angle is only worked out the first time it is asked for, as most
+        lines never need it.
+        """
+        if self._angle is None:
+            self._angle = math.atan2(self.dy, self.dx)
+        return self._angle
 
     @property
-    def dy(self):
-        """Return the difference in y-value between the end points."""
-        return self.b.y - self.a.y
+    def is_horizontal(self):
+        return self.dy == 0
 
     @property
-    def dx(self):
-        """Return the difference in x-value between the end points."""
-        return self.b.x - self.a.x
+    def is_vertical(self):
+        return self.dx == 0
 
     @property
     def gradient(self):
@@ -535,18 +573,6 @@ class Line(Geometry):
             return 0
         return self.dy / self.dx
 
-    @property
-    def angle(self):
-        """Return the direction of the line.
-
-        The result is the size of angle between the line and the positive X
-        axis, as a number of radians between π and -π.  A positive angle means
-        the line heads "above" the X axis, in the positive Y direction.  A
-        negative angle means the line heads "below" the X axis, in the negative
-        Y direction.
-        """
-        return math.atan2(self.dy, self.dx)
-
     def relative_angle(self, other):
         """Return the relative angle between this line and another line.
 
@@ -589,11 +615,13 @@ class Line(Geometry):
 
         Return None if this line is vertical.
         """
-        if self.is_vertical:
+        # The same sums as _y_at, from the stored differences.
+        dx, dy = self.dx, self.dy
+        if dx == 0:
             return None
-        if self.is_horizontal:
-            return self.a[1]
-        return self.a[1] + (x - self.a[0]) * self.gradient
+        if dy == 0:
+            return self.a.y
+        return self.a.y + (x - self.a.x) * (dy / dx)
 
     def get_y_intercept(self, y):
         """Return the x-value where the line intersects a horizontal.
@@ -603,11 +631,13 @@ class Line(Geometry):
 
         Return None if this line is horizontal.
         """
-        if self.is_horizontal:
+        # The same sums as _x_at, from the stored differences.
+        dx, dy = self.dx, self.dy
+        if dy == 0:
             return None
-        if self.is_vertical:
-            return self.a[0]
-        return self.a[0] + (y - self.a[1]) * 1 / self.gradient
+        if dx == 0:
+            return self.a.x
+        return self.a.x + (y - self.a.y) * dx / dy
 
     def intersects_x(self, x):
         """Return whether a line intersects with a vertical.
@@ -622,7 +652,9 @@ class Line(Geometry):
         x2 = self.b.x
         if x1 > x2:
             x1, x2 = x2, x1
-        return not (float_gt(x1, x) or float_lt(x2, x))
+        return not (
+                (x1 > x and not float_close(x1, x)) or
+                (x2 < x and not float_close(x2, x)))
 
     def intersects_y(self, y):
         """Return whether a line intersects with a horizontal.
@@ -637,7 +669,9 @@ class Line(Geometry):
         y2 = self.b.y
         if y1 > y2:
             y1, y2 = y2, y1
-        return not (float_gt(y1, y) or float_lt(y2, y))
+        return not (
+                (y1 > y and not float_close(y1, y)) or
+                (y2 < y and not float_close(y2, y)))
 
     def parallel(self, other):
         """Return whether this line is parallel with another line."""
@@ -654,19 +688,11 @@ class Line(Geometry):
         In this context, "right-hand" means from the point of view of an
         observer at point A, looking towards point B.
         """
-        a = self.a
-        b = self.b
-        p = Point(point)
-        # Shortcut case: point is equal to one of the line endpoints
-        if a == p or b == p:
-            return None
-
-        angle_ab = self.angle
-        angle_ap = Line(a, p).angle
-        if float_close(angle_ab, angle_ap):
+        p = point if isinstance(point, Point) else Point(point)
+        side = _orientation(self.a.x, self.a.y, self.b.x, self.b.y, p.x, p.y)
+        if side == 0:
             return None
-        relative_angle = normalise_angle(angle_ap - angle_ab)
-        return relative_angle < 0
+        return side > 0
 
     def extrapolate_intersection(self, other):
         """Return the point of intersection between two infinite lines.
@@ -676,43 +702,40 @@ class Line(Geometry):
 
         If the lines are parallel, return None.
         """
-        if self.is_vertical:
-            if other.is_vertical:
-                return None
-            if other.is_horizontal:
-                return Point(self.a[0], other.a[1])
-            xdist = self.a[0] - other.a[0]
-            return Point(self.a[0], other.a[1] + xdist * other.gradient)
-
-        if other.is_vertical:
-            if self.is_horizontal:
-                return Point(other.a[0], self.a[1])
-            xdist = other.a[0] - self.a[0]
-            return Point(other.a[0], self.a[1] + xdist * self.gradient)
-
-        if self.is_horizontal:
-            if other.is_horizontal:
-                return None
-            ydist = self.a[1] - other.a[1]
-            return Point(other.a[0] + ydist * 1 / other.gradient, self.a[1])
-
-        if other.is_horizontal:
-            ydist = other.a[1] - self.a[1]
-            return Point(self.a[0] + ydist * 1 / self.gradient, other.a[1])
-
-        if self.parallel(other):
+        ax, ay = self.a.x, self.a.y
+        cx, cy = other.a.x, other.a.y
+        abx, aby = self.dx, self.dy
+        cdx, cdy = other.dx, other.dy
+
+        # Solve for the intersection with Cramer's rule.  The denominator is
+        # the cross product of the two directions, so as in _orientation, we
+        # treat the lines as parallel if the sine of the angle between them is
+        # within ABS_TOL of zero.
+        denom = abx * cdy - aby * cdx
+        scale = (abx * abx + aby * aby) * (cdx * cdx + cdy * cdy)
+        if denom * denom <= scale * ABS_TOL * ABS_TOL:
             return None
-        if self.a == other.a or self.a == other.b:
+
+        # A shared endpoint is the intersection, exactly.
+        bx, by = self.b.x, self.b.y
+        dx, dy = other.b.x, other.b.y
+        if (ax == cx and ay == cy) or (ax == dx and ay == dy):
             return self.a
-        if self.b == other.a or self.b == other.b:
+        if (bx == cx and by == cy) or (bx == dx and by == dy):
             return self.b
 
-        convergence = self.gradient - other.gradient
-        assert convergence != 0
-
-        ydist = other.get_x_intercept(self.a[0]) - self.a[1]
-        x = self.a[0] + ydist / convergence
-        return Point(x, self.get_x_intercept(x))
+        # Walk along whichever line isn't axis-aligned, and take the other
+        # ordinate directly from a vertical or horizontal line, so that it is
+        # exact.
+        if abx == 0 or aby == 0:
+            u = ((cx - ax) * aby - (cy - ay) * abx) / denom
+            x = ax if abx == 0 else cx + u * cdx
+            y = ay if aby == 0 else cy + u * cdy
+        else:
+            t = ((cx - ax) * cdy - (cy - ay) * cdx) / denom
+            x = cx if cdx == 0 else ax + t * abx
+            y = cy if cdy == 0 else ay + t * aby
+        return Point(x, y)
 
     def intersects_point(self, point):
         """Return whether this line intersects with a Point.
@@ -720,27 +743,8 @@ class Line(Geometry):
         Return true if the point lies anywhere on the line between (and
         including) its endpoints, and false otherwise.
         """
-        if point == self.a or point == self.b:
-            return True
-
-        bbox = self.bbox
-        if bbox.disjoint(point):
-            return False
-
-        if self.is_vertical:
-            return (
-                    float_close(point.x, self.a.x) and not (
-                        float_lt(point.y, bbox.min_y) or
-                        float_gt(point.y, bbox.max_y)))
-
-        if self.is_horizontal:
-            return (
-                    float_close(point.y, self.a.y) and not (
-                        float_lt(point.x, bbox.min_x) or
-                        float_gt(point.x, bbox.max_x)))
-
-        y = self.get_x_intercept(point.x)
-        return float_close(y, point.y)
+        return _on_segment(
+                self.a.x, self.a.y, self.b.x, self.b.y, point.x, point.y)
 
     def intersects_line(self, other):
         """Return whether two bounded lines intersect each other.
@@ -748,18 +752,9 @@ class Line(Geometry):
         This is true if the two lines share any points along their length,
         including their endpoints.
         """
-        bbox = self.bbox
-        if bbox.disjoint(other.bbox):
-            return False
-        if (
-                self.a in {other.a, other.b} or
-                self.b in {other.a, other.b} or
-                self.intersects_point(other.a) or
-                self.intersects_point(other.b)):
-            return True
-
-        p = self.extrapolate_intersection(other)
-        return not (p is None or bbox.disjoint(p) or other.bbox.disjoint(p))
+        return _segments_intersect(
+                self.a.x, self.a.y, self.b.x, self.b.y,
+                other.a.x, other.a.y, other.b.x, other.b.y)
 
     def intersects(self, other):
         """Return whether this line intersects some other geometry.
@@ -897,11 +892,12 @@ class Line(Geometry):
         direction will be as the current line, rotated counter-clockwise by `angle`
         radians.
         """
-        xangle = normalise_angle(self.angle + angle)
-        x = length * math.cos(xangle)
-        y = math.sqrt(length**2 - x**2)
-        if xangle < 0:
-            y = -y
+        # Rotate this line's unit direction vector by 'angle', and scale it up
+        # to the new length.
+        scale = length / math.hypot(self.dx, self.dy)
+        cos, sin = math.cos(angle), math.sin(angle)
+        x = (self.dx * cos - self.dy * sin) * scale
+        y = (self.dx * sin + self.dy * cos) * scale
         c = (self.b.x + x, self.b.y + y)
         return Line(self.b, c)
 
@@ -940,7 +936,17 @@ class Line(Geometry):
         The result is a line with the same points, but travelling in the
         opposite direction (a and b are reversed).
         """
-        return Line(self.b, self.a)
+        # The endpoints are already known to be valid and distinct, so skip
+        # the constructor's conversion and validation.  The differences are
+        # recalculated rather than negated, so that a zero stays a positive
+        # zero, as it would from the constructor.
+        line = Line.__new__(Line)
+        line.a = self.b
+        line.b = self.a
+        line.dx = self.a.x - self.b.x
+        line.dy = self.a.y - self.b.y
+        line._angle = None
+        return line
 
     def __str__(self):
         return f"{self.a} → {self.b}"
@@ -1070,22 +1076,87 @@ class BoundingBox(Shape):
             return True
 
         if isinstance(other, Line):
-            for line in self.boundary:
-                if line.intersects(other):
-                    return True
-            return False
+            return self._intersects_segment(
+                    other.a.x, other.a.y, other.b.x, other.b.y)
 
         if isinstance(other, Polygon):
             if self.covers(other) or other.covers(self):
                 return True
-            for box_line in self.boundary:
-                for poly_line in other.lines:
-                    if box_line.intersects(poly_line):
-                        return True
+            for ax, ay, bx, by, _, _ in other._edges:
+                if self._intersects_segment(ax, ay, bx, by):
+                    return True
             return False
 
         if isinstance(other, Collection):
-            return any([self.intersects(x) for x in other])
+            return any(self.intersects(x) for x in other)
+
+    def _intersects_segment(self, ax, ay, bx, by):
+        """Return whether this box intersects the segment from 'a' to 'b'.
+
+        The arguments are plain numeric coordinates.  The segment intersects
+        the box if either endpoint is covered by the box, or if it crosses any
+        of the box's boundary lines.
+        """
+        min_x, min_y, max_x, max_y = self.as_tuple()
+        if (
+                float_lt(max(ax, bx), min_x) or
+                float_gt(min(ax, bx), max_x) or
+                float_lt(max(ay, by), min_y) or
+                float_gt(min(ay, by), max_y)):
+            return False
+
+        for x, y in ((ax, ay), (bx, by)):
+            if not (
+                    float_lt(x, min_x) or float_gt(x, max_x) or
+                    float_lt(y, min_y) or float_gt(y, max_y)):
+                return True
+
+        corners = (
+                (min_x, min_y), (min_x, max_y),
+                (max_x, max_y), (max_x, min_y), (min_x, min_y))
+        for (cx, cy), (dx, dy) in zip(corners[:-1], corners[1:]):
+            if _segments_intersect(ax, ay, bx, by, cx, cy, dx, dy):
+                return True
+        return False
+
+    def intersects_segments(self, values):
+        """Return whether this box intersects each of the given segments.
+
+        Each segment may be a Line, or a pair of points.  The result is a list
+        of booleans, one for each segment in 'values', in the same order.  This
+        gives the same answers as calling intersects for each Line.
+        """
+        result = []
+        for value in values:
+            if isinstance(value, Line):
+                a, b = value.a, value.b
+            else:
+                a, b = value
+            result.append(self._intersects_segment(a[0], a[1], b[0], b[1]))
+        return result
+
+    def contains_points(self, values):
+        """Return whether each of the given points is contained by this box.
+
+        The result is a list of booleans, one for each point in 'values', in
+        the same order.  This gives the same answers as calling contains for
+        each point, so points on the boundary are not contained.
+        """
+        min_x, min_y, max_x, max_y = self.as_tuple()
+        # An inner box, shrunk by more than float_close's tolerance at the
+        # box's own magnitude.  Points inside it are contained without any
+        # tolerance tests; only those nearer the boundary need them.
+        pad_x = 2 * (ABS_TOL + 1e-9 * max(abs(min_x), abs(max_x)))
+        pad_y = 2 * (ABS_TOL + 1e-9 * max(abs(min_y), abs(max_y)))
+        inner_min_x, inner_max_x = min_x + pad_x, max_x - pad_x
+        inner_min_y, inner_max_y = min_y + pad_y, max_y - pad_y
+        return [
+                (
+                    inner_min_x < p[0] < inner_max_x and
+                    inner_min_y < p[1] < inner_max_y) or (
+                    float_gt(p[0], min_x) and float_lt(p[0], max_x) and
+                    float_gt(p[1], min_y) and float_lt(p[1], max_y))
+                for p in values]
 
     def contains(self, other):
         if isinstance(other, Point):
@@ -1117,15 +1188,14 @@ class BoundingBox(Shape):
                     float_gt(other.max_y, self.max_y))
 
         if isinstance(other, Polygon):
-            for p in other.points:
-                if self.disjoint(p):
-                    return False
-            return True
+            # No vertex lies outside the box if and only if the polygon's own
+            # bounding box doesn't.
+            return self.covers(other._bbox)
 
         if isinstance(other, Collection):
             return (
                     self.covers(other) and
-                    any([self.contains(x) for x in other]))
+                    any(self.contains(x) for x in other))
 
     def covers(self, other):
         if isinstance(other, Point):
@@ -1143,13 +1213,12 @@ class BoundingBox(Shape):
                     float_gt(other.max_y, self.max_y))
 
         if isinstance(other, Polygon):
-            for p in other.points:
-                if self.disjoint(p):
-                    return False
-            return True
+            # No vertex lies outside the box if and only if the polygon's own
+            # bounding box doesn't.
+            return self.covers(other._bbox)
 
         if isinstance(other, Collection):
-            return all([self.covers(x) for x in other])
+            return all(self.covers(x) for x in other)
 
     def intersection_line(self, other):
         """Return the intersection of this box with a Line.
@@ -1235,7 +1304,7 @@ class BoundingBox(Shape):
         if not isinstance(other, BoundingBox):
             raise NotImplementedError()
         z = zip(self.as_tuple(), other.as_tuple())
-        return all([float_close(a, b) for a, b in z])
+        return all(float_close(a, b) for a, b in z)
 
     def __str__(self):
         return f"{self.min_x},{self.min_y},{self.max_x},{self.max_y}"
@@ -1260,37 +1329,49 @@ class Polygon(Shape):
     redundant points, and close the polygon if it is not already closed (i.e.
     ensure that the last point in the polygon is the same as the first point).
     """
-    __slots__ = ['points']
+    __slots__ = [
+            'points', '_xy', '_xs', '_ys', '_edges', '_lines', '_bbox',
+            '_convex', '_start', '_hash', '_index', '_tree', '_area']
 
     def __init__(self, value):
         if isinstance(value, Polygon):
             self.points = value.points
+            self._xy = value._xy
+            self._xs = value._xs
+            self._ys = value._ys
+            self._edges = value._edges
+            self._lines = value._lines
+            self._bbox = value._bbox
+            self._convex = value._convex
+            self._start = value._start
+            self._hash = value._hash
+            self._index = value._index
+            self._tree = value._tree
+            self._area = value._area
             return
 
-        points = [Point(x) for x in value]
+        points = [x if isinstance(x, Point) else Point(x) for x in value]
 
         # Filter out consecutive identical points.
-        last = None
-        distinct = []
-        for p in points:
-            if last is None or p != last:
-                distinct.append(p)
-                last = p
-        points = distinct
-
-        # Filter out redundant points.
-        length = len(points)
-        boundary = []
-        for i, p in enumerate(points):
-            if i > 0 and i < length - 1:
-                # If the boundary doesn't change angle after this point,
-                # then it makes no difference to the shape whether it is
-                # included or not.  So don't.
-                a = Line(points[i-1], p)
-                b = Line(p, points[i+1])
-                if a.angle == b.angle:
-                    continue
-            boundary.append(p)
+        points = points[:1] + [
+                p for prev, p in zip(points[:-1], points[1:])
+                if p.x != prev.x or p.y != prev.y]
+
+        # Filter out redundant points.  If the boundary doesn't change angle
+        # after a point, then it makes no difference to the shape whether it
+        # is included or not.  So don't.  Each segment's angle is worked out
+        # once, and shared by the points at either end of it.
+        boundary = points
+        if len(points) > 2:
+            angles = [
+                    Line(a, b).angle
+                    for a, b in zip(points[:-1], points[1:])]
+            boundary = [points[0]]
+            boundary.extend(
+                    p for p, before, after
+                    in zip(points[1:-1], angles[:-1], angles[1:])
+                    if before != after)
+            boundary.append(points[-1])
 
         # If the polygon isn't closed, close it now.
         if boundary and boundary[0] != boundary[-1]:
@@ -1300,24 +1381,32 @@ class Polygon(Shape):
             raise ValueError("Not enough valid points for a closed polygon.")
 
         self.points = tuple(boundary)
-
-        # Disallow backtracking along the same line
-        lines = self.lines
-        length = len(lines)
-        for i in range(length - 1):
-            if (lines[i].angle == (-lines[i+1]).angle):
-                raise ValueError(
-                        f"Line {lines[i+1]} backtracks "
-                        "along the previous line.")
-
-        # Disallow self-intersection
-        for i in range(length):
-            for j in range(length):
-                if i in {j, (j + 1) % length, (j - 1) % length}:
-                    continue
-                if lines[i].intersects(lines[j]):
-                    raise ValueError(
-                            f"Line {lines[i]} intersects with {lines[j]}.")
+        self._xy = tuple((p.x, p.y) for p in boundary)
+        # The same coordinates, stored column-wise for whole-ring passes.
+        self._xs = tuple(p.x for p in boundary)
+        self._ys = tuple(p.y for p in boundary)
+        self._edges = _ring_edges(self._xy)
+        _validate_ring(self._edges)
+
+        # The Line objects are only built if asked for, as most of the
+        # predicates work from the plain edge tuples.
+        self._lines = None
+        # Likewise, the edge indexes are built on the first query that uses
+        # them.
+        self._index = None
+        self._tree = None
+        self._area = None
+
+        self._bbox = BoundingBox(
+                min(self._xs), min(self._ys), max(self._xs), max(self._ys))
+
+        self._convex = _is_convex(self._xs, self._ys)
+
+        # Find the standard starting point (see points_standard) once, and
+        # hash the ring from there, so that comparisons don't need to.
+        xy = self._xy
+        self._start = min(range(len(xy)), key=xy.__getitem__)
+        self._hash = hash(tuple('Polygon') + self._standard_xy())
 
     def __len__(self):
         return len(self.points)
@@ -1336,8 +1425,11 @@ class Polygon(Shape):
         To test whether a geometry is spatially contained in the polygon, use
         contains().
         """
-        p = Point(point)
-        return any([p.equals(x) for x in self.points])
+        p = point if isinstance(point, Point) else Point(point)
+        x, y = p.x, p.y
+        return any(
+                float_close(x, vx) and float_close(y, vy)
+                for vx, vy in self._xy)
 
     def __str__(self):
         return " → ".join(map(str, self.points))
@@ -1351,13 +1443,20 @@ class Polygon(Shape):
         """
         if not isinstance(other, Polygon):
             return False
-        if len(self) != len(other):
+        if len(self) != len(other) or self._hash != other._hash:
             return False
 
-        return self.points_standard == other.points_standard
+        return self._standard_xy() == other._standard_xy()
 
     def __hash__(self):
-        return hash(tuple('Polygon') + self.points_standard)
+        return self._hash
+
+    def _standard_xy(self):
+        """Return the coordinates of points_standard, as plain tuples."""
+        start = self._start
+        if start == 0:
+            return self._xy
+        return self._xy[start:] + self._xy[1:start+1]
 
     @property
     def points_standard(self):
@@ -1371,13 +1470,7 @@ class Polygon(Shape):
         The main purpose of this property is to enable "apples to apples"
         comparisons between two polygons, and also to make Polygon hashable.
         """
-        start = 0
-        min_x = None
-        min_y = None
-        for i, p in enumerate(self.points):
-            if min_x is None or p.x < min_x or (p.x == min_x and p.y < min_y):
-                start = i
-                min_x, min_y = p.x, p.y
+        start = self._start
         if start == 0:
             return self.points
         return self.points[start:] + self.points[1:start+1]
@@ -1385,25 +1478,27 @@ class Polygon(Shape):
     @property
     def bbox(self):
         """Return the bounding box for this polygon."""
-        min_x = None
-        min_y = None
-        max_x = None
-        max_y = None
-        for p in self.points:
-            if min_x is None or p.x < min_x:
-                min_x = p.x
-            if min_y is None or p.y < min_y:
-                min_y = p.y
-            if max_x is None or p.x > max_x:
-                max_x = p.x
-            if max_y is None or p.y > max_y:
-                max_y = p.y
-        return BoundingBox(min_x, min_y, max_x, max_y)
+        return self._bbox
 
     @property
     def lines(self):
         """Return an iterable of all the line segments in the polygon."""
-        return [Line(self[i], self[i+1]) for i in range(len(self) - 1)]
+        if self._lines is None:
+            points = self.points
+            self._lines = tuple(
+                    Line(a, b) for a, b in zip(points[:-1], points[1:]))
+        return self._lines
+
+    @property
+    def area(self):
+        """Return the area enclosed by this polygon."""
+        return abs(signed_area(self))
+
+    def _signed_area(self):
+        """Return the signed area of this polygon, worked out on first use."""
+        if self._area is None:
+            self._area = _shoelace(self._xs, self._ys)
+        return self._area
 
     @property
     def is_convex(self):
@@ -1412,10 +1507,7 @@ class Polygon(Shape):
         The polygon is considered convex if no point lies on the left-hand side
         of the line formed by the preceding two points.
         """
-        for i in range(0, len(self) - 2):
-            if in_bound(self[i], self[i+1], self[i+2]) is False:
-                return False
-        return True
+        return self._convex
 
     def contains_point(self, value):
         """Return whether the given point is contained by this polygon.
@@ -1423,56 +1515,132 @@ class Polygon(Shape):
         A polygon only contains points that lie within its interior.  Points on
         the boundary of the polygon are not contained by it.
         """
-        p = Point(value)
+        p = value if isinstance(value, Point) else Point(value)
 
         # Shortcut case: if the point is not contained by the polygon's
         # bounding box, then it is definitely not contained by the polygon.
         if not self.bbox.contains(p):
             return False
 
-        # Shortcut case: if the point is equal to one of the polygon's
-        # vertices, then it is on the boundary.
-        if p in self:
-            return False
-
-        lines = self.lines
-        # Check for the point lying exactly on a boundary line.
-        for line in lines:
-            if line.intersects_point(p):
-                return False
-
-        # Search for the nearest line segment on either side of the point that
-        # lie on the same horizontal.
-        hlines = [l for l in lines if l.intersects_y(p.y)]
-        if not hlines:
-            return False
-
-        xdiffs = [l.get_y_intercept(p.y) - p.x for l in hlines]
-
-        left = None
-        right = None
-        negx = None
-        posx = None
-        for i, x in enumerate(xdiffs):
-            if x < 0 and (negx is None or x > negx):
-                left = i
-                negx = x
-            if x > 0 and (posx is None or x < posx):
-                right = i
-                posx = x
-
-        if left is None or right is None:
-            return False
+        return self._contains_xy(p.x, p.y)
+
+    def _contains_xy(self, x, y):
+        """Return whether the point (x, y) is contained by this polygon.
+
+        This skips the bounding box shortcut, so callers should check that
+        first.  Convex polygons are tested in O(log n), and everything else
+        falls back to the ray-cast kernel.
+        """
+        if self._convex:
+            result = _point_in_convex_ring(self._xy, x, y)
+            if result is not None:
+                return result
+        return _point_in_ring(self._edges_at(y), x, y, False)
+
+    def _covers_xy(self, x, y):
+        """Return whether the point (x, y) is in or on this polygon.
+
+        This goes straight to the ray-cast kernel, so callers testing many
+        vertices can skip building a Point and dispatching through
+        intersects() for each one.
+        """
+        return _point_in_ring(self._edges_at(y), x, y, True)
+
+    def _edges_at(self, y):
+        """Return the edges that a point query at height 'y' needs to visit.
+
+        For larger polygons, this only includes the edges whose vertical span
+        takes in 'y', looked up from an index that is built on first use.  The
+        result can be passed to _point_in_ring in place of all the edges.
+        """
+        edges = self._edges
+        if len(edges) < INDEX_MIN_EDGES:
+            return edges
+        if self._index is None:
+            self._index = _ring_index(edges)
+        return _index_lookup(self._index, y)
+
+    def _edges_near(self, min_x, min_y, max_x, max_y):
+        """Return the indexes of edges that a segment with the given bounds
+        might meet, in ascending order.
+
+        For larger polygons, this only includes the edges whose bounding boxes
+        come within tolerance of the given bounds, looked up from a tree that
+        is built on first use.
+        """
+        edges = self._edges
+        if len(edges) < INDEX_MIN_EDGES:
+            return range(len(edges))
+        if self._tree is None:
+            self._tree = _edge_tree(edges)
+        return sorted(_tree_query(self._tree, min_x, min_y, max_x, max_y))
+
+    def _edges_meeting(self, line):
+        """Return the indexes of edges that intersect a Line, in order."""
+        cx, cy, dx, dy = line.a.x, line.a.y, line.b.x, line.b.y
+        edges = self._edges
+        near = self._edges_near(
+                min(cx, dx), min(cy, dy), max(cx, dx), max(cy, dy))
+        return [
+                i for i in near
+                if _segments_intersect(*edges[i][:4], cx, cy, dx, dy)]
+
+    def contains_points(self, values):
+        """Return whether each of the given points is contained by this polygon.
+
+        The result is a list of booleans, one for each point in 'values', in
+        the same order.  This gives the same answers as calling contains_point
+        for each point, but only does the per-polygon setup once, so prefer it
+        when testing many points against the same polygon.  Plain (x, y)
+        tuples are accepted, and avoid building a Point for each one.
+
+        For a polygon that isn't convex, points at the same height are
+        classified together, as a row of points_in_grid would be, so a batch
+        laid out in rows only works out the edge crossings once per row.
+        """
+        coords = []
+        for value in values:
+            if isinstance(value, tuple):
+                coords.append(value)
+            else:
+                p = value if isinstance(value, Point) else Point(value)
+                coords.append((p.x, p.y))
 
-        rline = hlines[right]
-        lline = hlines[left]
-        return rline.a.y > rline.b.y and lline.a.y < lline.b.y
+        # Shortcut: points not contained by the bounding box are not contained
+        # by the polygon, by the same test as contains_point.
+        inside = self.bbox.contains_points(coords)
+        result = []
+        rows = {}
+        for (x, y), flag in zip(coords, inside):
+            if not flag:
+                result.append(False)
+            elif self._convex:
+                result.append(self._contains_xy(x, y))
+            else:
+                rows.setdefault(y, []).append(len(result))
+                result.append(x)
+
+        # The positions held for the rows' points still have their x-values
+        # in them, until they are replaced with the answers.
+        for y, row in rows.items():
+            edges = self._edges_at(y)
+            if len(row) == 1:
+                i = row[0]
+                result[i] = _point_in_ring(edges, result[i], y, False)
+                continue
+            flags = _grid_row(edges, [result[i] for i in row], y, False)
+            for i, flag in zip(row, flags):
+                result[i] = flag
+        return result
 
     def contains_line(self, other):
         """Return whether this polygon contains a Line.
 
         See comments at Shape.contains for the particulars.
         """
+        if not self._bbox.covers(other.bbox):
+            return False
+
         if self.disjoint(other.a) or self.disjoint(other.b):
             return False
 
@@ -1485,9 +1653,9 @@ class Polygon(Shape):
                     return False
             return True
 
-        if any([x == other for x in self.lines]):
+        if any(x == other for x in self.lines):
             return False
-        lines = [x for x in self.lines if x.intersects(other)]
+        lines = [self.lines[i] for i in self._edges_meeting(other)]
         length = len(lines)
         if length == 0:
             # No line intersections, must be fully internal
@@ -1511,9 +1679,11 @@ class Polygon(Shape):
 
         See comments at Shape.contains for the particulars.
         """
-        points = other.points
-        for p in points:
-            if self.disjoint(p):
+        if not self._bbox.covers(other):
+            return False
+
+        for p in other.points:
+            if not self._covers_xy(p.x, p.y):
                 return False
 
         if self.is_convex:
@@ -1529,11 +1699,17 @@ class Polygon(Shape):
 
         See comments at Shape.contains for the particulars.
         """
-        for p in other.points:
-            if self.disjoint(p):
+        if not self._bbox.covers(other._bbox):
+            return False
+
+        # Cheap rejection first: if any vertex of the other polygon lies
+        # outside this one, it can't be contained.  The other polygon's box is
+        # within ours, so go straight to the ray cast for each vertex.
+        for x, y in other._xy:
+            if not self._covers_xy(x, y):
                 return False
 
-        if self.is_convex:
+        if self._convex:
             return True
 
         for line in other.lines:
@@ -1549,9 +1725,9 @@ class Polygon(Shape):
         if isinstance(other, Point):
             return self.contains_point(other)
 
-        # Shortcut: if the geometry is outside this polygon's bounding box,
-        # then it definitely isn't contained by the polygon.
-        if self.bbox.disjoint(other):
+        # Shortcut: if the geometry's bounding box isn't within this polygon's
+        # bounding box, then it definitely isn't contained by the polygon.
+        if not self._bbox.covers(other.bbox):
             return False
 
         if isinstance(other, Line):
@@ -1566,7 +1742,7 @@ class Polygon(Shape):
         if isinstance(other, Collection):
             return (
                     self.covers(other) and
-                    any([self.contains(x) for x in other]))
+                    any(self.contains(x) for x in other))
 
         raise ValueError(
                 f"Unsupported type for polygon contains: {type(other)}.")
@@ -1585,15 +1761,25 @@ class Polygon(Shape):
         if self.is_convex:
             return True
 
-        if any([x == other for x in self.lines]):
-            return True
+        lines = [self.lines[i] for i in self._edges_meeting(other)]
+        return self._covers_line_meeting(other, lines)
+
+    def _covers_line_meeting(self, other, lines):
+        """Return whether this polygon covers a Line, given the boundary
+        lines that it meets.
 
-        lines = [x for x in self.lines if x.intersects(other)]
+        'lines' must be the polygon's lines that intersect 'other', as found
+        by _edges_meeting, and both of the Line's endpoints must already be
+        known to be covered.  This lets callers that need those lines anyway
+        share a single pass over the polygon's edges.
+        """
         length = len(lines)
         if length == 0:
             # No line intersections, must be fully internal
             return True
-        if len(lines) == 1 and isinstance(lines[0] & other, Line):
+        if any(x == other for x in lines):
+            return True
+        if length == 1 and isinstance(lines[0] & other, Line):
             # Line intersection on exactly one boundary
             return True
 
@@ -1612,9 +1798,11 @@ class Polygon(Shape):
 
         See comments at Shape.covers for the particulars.
         """
-        points = other.points
-        for p in points:
-            if self.disjoint(p):
+        if not self._bbox.covers(other):
+            return False
+
+        for p in other.points:
+            if not self._covers_xy(p.x, p.y):
                 return False
 
         if self.is_convex:
@@ -1626,11 +1814,13 @@ class Polygon(Shape):
         return True
 
     def covers(self, other):
-        if self.disjoint(other):
-            return False
-
         if isinstance(other, Point):
-            return True
+            return not self.disjoint(other)
+
+        # Shortcut: if the geometry's bounding box isn't within this polygon's
+        # bounding box, then it definitely isn't covered by the polygon.
+        if not self._bbox.covers(other.bbox):
+            return False
 
         if isinstance(other, Line):
             return self.covers_line(other)
@@ -1651,8 +1841,17 @@ class Polygon(Shape):
 
         See comments at Geometry.intersects for the particulars.
         """
-        for line in self.lines:
-            if line.intersects(other):
+        # Shortcut: as in intersects, a Line outside this polygon's bounding
+        # box can't meet it.  The same goes for the other methods below.
+        if self._bbox.disjoint(other.bbox):
+            return False
+
+        cx, cy, dx, dy = other.a.x, other.a.y, other.b.x, other.b.y
+        edges = self._edges
+        near = self._edges_near(
+                min(cx, dx), min(cy, dy), max(cx, dx), max(cy, dy))
+        for i in near:
+            if _segments_intersect(*edges[i][:4], cx, cy, dx, dy):
                 return True
         return self.contains(other)
 
@@ -1661,27 +1860,89 @@ class Polygon(Shape):
 
         See comments at geometry.intersects for the particulars.
         """
-        for point in other.points:
-            if self.intersects(point):
+        if self._bbox.disjoint(other):
+            return False
+
+        for p in other.points:
+            if self._covers_xy(p.x, p.y):
                 return True
 
-        for line in self.lines:
-            if other.intersects(line):
+        # Classify each vertex by which sides of the box it lies beyond, in
+        # the manner of Cohen-Sutherland outcodes.  A vertex beyond none of
+        # them is covered by the box.
+        min_x, min_y, max_x, max_y = other.as_tuple()
+        codes = []
+        for x, y in self._xy:
+            code = 0
+            if x < min_x and not float_close(x, min_x):
+                code = 1
+            elif x > max_x and not float_close(x, max_x):
+                code = 2
+            if y < min_y and not float_close(y, min_y):
+                code |= 4
+            elif y > max_y and not float_close(y, max_y):
+                code |= 8
+            if code == 0:
                 return True
-        return other.contains(self)
+            codes.append(code)
+
+        # With every vertex outside the box, an edge can only meet it by
+        # crossing its boundary, which it can't do if both of its ends lie
+        # beyond the same side.  That also rules out the box containing this
+        # polygon.
+        for i, (ax, ay, bx, by, _, _) in enumerate(self._edges):
+            if codes[i] & codes[i + 1]:
+                continue
+            if other._intersects_segment(ax, ay, bx, by):
+                return True
+        return False
 
     def intersects_polygon(self, other):
         """Return whether this polygon intersects another polygon.
 
         See comments at geometry.intersects for the particulars.
         """
-        for point in other.points:
-            if self.intersects(point):
+        if self._bbox.disjoint(other._bbox):
+            return False
+
+        for x, y in other._xy:
+            if self._covers_xy(x, y):
                 return True
 
-        for line in other.lines:
-            if self.intersects(line):
+        if self._convex and other._convex:
+            # Two convex polygons are disjoint if and only if some edge normal
+            # separates them, which is much cheaper to find than testing every
+            # pair of edges.  Only trust a gap that is clear of the tolerance;
+            # for anything closer, fall back to the edge tests below, so that
+            # touching is judged the same way as elsewhere.  An overlap would
+            # need every axis checked, so first catch the usual kind, where a
+            # vertex of this polygon lies within the other.
+            for x, y in self._xy:
+                if other._covers_xy(x, y):
+                    return True
+            # A gap this narrow may be down to the tolerances of _orientation
+            # and float_close, across the full extent of both polygons.
+            min_x, min_y, max_x, max_y = self._bbox.as_tuple()
+            min_x = min(min_x, other._bbox.min_x)
+            min_y = min(min_y, other._bbox.min_y)
+            max_x = max(max_x, other._bbox.max_x)
+            max_y = max(max_y, other._bbox.max_y)
+            span = max(max_x - min_x, max_y - min_y)
+            magnitude = max(abs(min_x), abs(min_y), abs(max_x), abs(max_y))
+            margin = 2 * (ABS_TOL * (1 + span) + 1e-9 * magnitude)
+
+            gap = _separation(self._xy, other._xy, margin)
+            if gap <= 0:
                 return True
+            if gap > margin:
+                return False
+
+        # With none of the other polygon's vertices touching this one, the
+        # boundaries can only meet where a pair of edges cross.
+        for cx, cy, dx, dy, _, _ in other._edges:
+            for ax, ay, bx, by, _, _ in self._edges:
+                if _segments_intersect(ax, ay, bx, by, cx, cy, dx, dy):
+                    return True
         return other.contains(self)
 
     def intersects(self, other):
@@ -1690,16 +1951,16 @@ class Polygon(Shape):
         See comments at Geometry.intersects for the particulars.
         """
         # Shortcut: if the geometry is outside this polygon's bounding box,
-        # then it definitely doesn't intersect with the polygon.
-        if self.bbox.disjoint(other):
+        # then it definitely doesn't intersect with the polygon.  Compare
+        # against the geometry's own box, which is much cheaper than testing
+        # the box against the full geometry.
+        if self._bbox.disjoint(
+                other if isinstance(other, Point) else other.bbox):
             return False
 
         if isinstance(other, Point):
             # True if the point is on the boundary or in the interior.
-            for line in self.lines:
-                if line.intersects_point(other):
-                    return True
-            return self.contains_point(other)
+            return self._covers_xy(other.x, other.y)
 
         if isinstance(other, Line):
             return self.intersects_line(other)
@@ -1719,13 +1980,12 @@ class Polygon(Shape):
         The result will be None, a Point, a Line, or a Collection of Points and
         Lines.
         """
-        if self.disjoint(other):
-            return None
-
-        if self.covers(other):
-            return other
-
         if self.is_convex:
+            if self.disjoint(other):
+                return None
+            if self.covers(other):
+                return other
+
             result = other
             for line in self.lines:
                 crop = result.crop_line(line)
@@ -1736,10 +1996,23 @@ class Polygon(Shape):
 
         # Non-convex, yuck.  Surely there is a more elegant way to do this, but
         # for now this is all I've got ...
-        lines = [x for x in self.lines if x.intersects(other)]
-        if not lines:
+        if self._bbox.disjoint(other.bbox):
             return None
 
+        # Find the boundary lines the line meets in a single pass, and use them
+        # for the disjoint and covers tests as well as the cropping below.
+        lines = [self.lines[i] for i in self._edges_meeting(other)]
+        a, b = other.a, other.b
+        if not lines:
+            # Without touching the boundary, the line lies either wholly
+            # inside the polygon or wholly outside it.
+            return other if self._covers_xy(a.x, a.y) else None
+        if (
+                self._covers_xy(a.x, a.y) and
+                self._covers_xy(b.x, b.y) and
+                self._covers_line_meeting(other, lines)):
+            return other
+
         intersections = {x: other.intersection(x) for x in lines}
 
         def sortkey(line):
@@ -1760,7 +2033,7 @@ class Polygon(Shape):
         # Filter out points that are covered by lines.
         def f(x):
             return not isinstance(x, Point) or all(
-                    [x.disjoint(y) for y in result if x != y])
+                    x.disjoint(y) for y in result if x != y)
         result = list(filter(f, result))
 
         # Merge adjacent lines together
@@ -1871,8 +2144,7 @@ class Polygon(Shape):
 
     def move(self, x=0, y=0):
         """Return a new Polygon spatially shifted relative to this one."""
-        points = [p.move(x, y) for p in self.points]
-        return Polygon(points)
+        return Polygon([(px + x, py + y) for px, py in self._xy])
 
     def crop_line(self, line):
         """Crop a polygon along an infinite line.
@@ -2003,9 +2275,7 @@ class Polygon(Shape):
         return union(*result)
 
     def add_to_plot(self, plot):
-        x = [p.x for p in self.points]
-        y = [p.y for p in self.points]
-        plot.ax.plot(x, y)
+        plot.ax.plot(self._xs, self._ys)
 
 
 class HomogeneousCollection(Collection):
@@ -2035,6 +2305,46 @@ class MultiPolygon(Shape, HomogeneousCollection):
     item_type = Polygon
 
 
+class PolygonIndex():
+    """A spatial index over a fixed sequence of polygons.
+
+    This finds which of many polygons contain a point, without testing the
+    point against every one of them.  The polygons' bounding boxes are
+    bulk-loaded into a tree (see _box_tree), so that each query only casts
+    rays against the polygons whose boxes lie near the point.
+
+    The polygons may be given as Polygons, or as any sequences of points,
+    which are made into Polygons.  Either way, the index refers to them by
+    their position in the sequence.
+    """
+    __slots__ = ['polygons', '_tree']
+
+    def __init__(self, polygons):
+        self.polygons = tuple(
+                x if isinstance(x, Polygon) else Polygon(x) for x in polygons)
+        self._tree = None
+        if self.polygons:
+            self._tree = _box_tree([x._bbox.as_tuple() for x in self.polygons])
+
+    def __len__(self):
+        return len(self.polygons)
+
+    def query(self, point, exact=True):
+        """Return the indexes of the polygons that contain a point.
+
+        Each polygon is judged as by point_in_polygon, so if the point lies
+        exactly on a polygon's boundary, that polygon is included if 'exact'
+        is true.  The indexes are returned in ascending order.
+        """
+        if self._tree is None:
+            return []
+        x, y = point[0], point[1]
+        polygons = self.polygons
+        return [
+                i for i in sorted(_tree_query(self._tree, x, y, x, y))
+                if point_in_polygon(polygons[i], (x, y), exact)]
+
+
 # Class aliases
 P = Point
 L = Line
@@ -2059,8 +2369,623 @@ def point_eq(a, b):
     return a == b
 
 
+def _coords(poly):
+    """Return the vertices of a polygon as a list of plain (x, y) tuples.
+
+    The polygon may be given as any sequence of coordinate pairs, including
+    Point objects or a Polygon.  This is the single point of conversion for the
+    module-level polygon functions, which then work on the plain coordinates.
+    """
+    if isinstance(poly, Polygon):
+        return poly._xy
+    return [(p[0], p[1]) for p in poly]
+
+
+def _columns(poly):
+    """Return the vertices of a polygon as two sequences, of x and of y.
+
+    Accepts the same inputs as _coords.  For a Polygon, the columns stored at
+    construction are returned directly.
+    """
+    if isinstance(poly, Polygon):
+        return poly._xs, poly._ys
+    coords = _coords(poly)
+    return [x for x, _ in coords], [y for _, y in coords]
+
+
+def _x_at(ax, ay, bx, by, y):
+    """Return the x-value where the line through 'a' and 'b' meets a horizontal.
+
+    All arguments are plain numeric coordinates, and the line is considered to
+    extend infinitely in both directions.  Return None if the line is itself
+    horizontal.
+    """
+    if ay == by:
+        return None
+    if ax == bx:
+        return ax
+    return ax + (y - ay) * (bx - ax) / (by - ay)
+
+
+def _y_at(ax, ay, bx, by, x):
+    """Return the y-value where the line through 'a' and 'b' meets a vertical.
+
+    All arguments are plain numeric coordinates, and the line is considered to
+    extend infinitely in both directions.  Return None if the line is itself
+    vertical.
+    """
+    if ax == bx:
+        return None
+    if ay == by:
+        return ay
+    return ay + (x - ax) * ((by - ay) / (bx - ax))
+
+
+def _on_segment(ax, ay, bx, by, px, py):
+    """Return whether the point (px, py) lies on the segment from 'a' to 'b'.
+
+    All arguments are plain numeric coordinates.  This is the test behind
+    Line.intersects_point: the point must be within the segment's bounding
+    box, and within tolerance of the segment's y-value at px (or of its
+    x-value, if the segment is vertical), with every comparison made by
+    float_close.
+    """
+    if (px == ax and py == ay) or (px == bx and py == by):
+        return True
+
+    # Shortcut: the point can't be on the line if it is outside the line's
+    # bounding box.  This is the same test as BoundingBox.disjoint, without
+    # building the box.
+    low, high = (ax, bx) if ax < bx else (bx, ax)
+    if (
+            (px < low and not float_close(px, low)) or
+            (px > high and not float_close(px, high))):
+        return False
+    low, high = (ay, by) if ay < by else (by, ay)
+    if (
+            (py < low and not float_close(py, low)) or
+            (py > high and not float_close(py, high))):
+        return False
+
+    # Having passed the box test, a point in line with a vertical or
+    # horizontal is on it.
+    dx = bx - ax
+    if dx == 0:
+        return float_close(px, ax)
+    dy = by - ay
+    if dy == 0:
+        return float_close(py, ay)
+    # Same sum as _y_at, whose own vertical and horizontal checks have
+    # already been made above.
+    return float_close(ay + (px - ax) * (dy / dx), py)
+
+
+def _orientation(ax, ay, bx, by, px, py):
+    """Return which side of the line from 'a' to 'b' the point 'p' lies on.
+
+    All arguments are plain numeric coordinates.  The result is 1 if 'p' lies
+    on the right-hand side of the line, -1 if it lies on the left-hand side, or
+    0 if it lies on the line (extended infinitely in both directions).
+
+    The test is the sign of the cross product of AB and AP.  That cross product
+    is |AB| * |AP| * sin(θ), where θ is the angle between the two vectors, so
+    we consider the point to be on the line when sin(θ) is within ABS_TOL of
+    zero.  Comparing the squares avoids taking any square roots.
+    """
+    abx = bx - ax
+    aby = by - ay
+    apx = px - ax
+    apy = py - ay
+    cross = abx * apy - aby * apx
+    scale = (abx * abx + aby * aby) * (apx * apx + apy * apy)
+    if cross * cross <= scale * ABS_TOL * ABS_TOL:
+        return 0
+    return 1 if cross < 0 else -1
+
+
+def _segments_intersect(ax, ay, bx, by, cx, cy, dx, dy):
+    """Return whether two bounded line segments intersect.
+
+    All arguments are plain numeric coordinates, for the segments from 'a' to
+    'b' and from 'c' to 'd'.  The result is True if the segments share any
+    points, including their endpoints.
+    """
+    # Shortcut: the segments can't intersect if their bounding boxes don't.
+    # This is the same test as float_lt and float_gt, but only pays for the
+    # tolerance check on a pair that fails the plain comparison, which is
+    # usually a pair of boxes that really are apart.
+    low, high = (ax, bx) if ax < bx else (bx, ax)
+    other_low, other_high = (cx, dx) if cx < dx else (dx, cx)
+    if high < other_low and not float_close(high, other_low):
+        return False
+    if other_high < low and not float_close(other_high, low):
+        return False
+    low, high = (ay, by) if ay < by else (by, ay)
+    other_low, other_high = (cy, dy) if cy < dy else (dy, cy)
+    if high < other_low and not float_close(high, other_low):
+        return False
+    if other_high < low and not float_close(other_high, low):
+        return False
+
+    # Reject the pair if both ends of either segment lie strictly on the same
+    # side of the other.  These are the four tests _orientation would make,
+    # inlined to save the calls, which dominate the cost for small polygons.
+    tol = ABS_TOL * ABS_TOL
+    abx = bx - ax
+    aby = by - ay
+    ab2 = abx * abx + aby * aby
+    acx = cx - ax
+    acy = cy - ay
+    c_cross = abx * acy - aby * acx
+    if c_cross * c_cross > ab2 * (acx * acx + acy * acy) * tol:
+        adx = dx - ax
+        ady = dy - ay
+        d_cross = abx * ady - aby * adx
+        if (
+                d_cross * d_cross > ab2 * (adx * adx + ady * ady) * tol and
+                (c_cross < 0) == (d_cross < 0)):
+            return False
+
+    cdx = dx - cx
+    cdy = dy - cy
+    cd2 = cdx * cdx + cdy * cdy
+    cax = ax - cx
+    cay = ay - cy
+    a_cross = cdx * cay - cdy * cax
+    if a_cross * a_cross > cd2 * (cax * cax + cay * cay) * tol:
+        cbx = bx - cx
+        cby = by - cy
+        b_cross = cdx * cby - cdy * cbx
+        if (
+                b_cross * b_cross > cd2 * (cbx * cbx + cby * cby) * tol and
+                (a_cross < 0) == (b_cross < 0)):
+            return False
+
+    # If the segments are collinear, the bounding box check above has already
+    # established that they overlap.
+    return True
+
+
+def _separation(a, b, margin):
+    """Return how far apart two convex rings are along their edge normals.
+
+    'a' and 'b' must be sequences of plain (x, y) tuples forming closed,
+    convex rings.  Each edge normal of either ring is a candidate separating
+    axis, and the result is the widest gap between the rings' projections
+    onto any of them, as a distance.  If the rings overlap along every axis,
+    it is zero or negative, and the rings intersect.
+
+    The search stops early at any gap wider than 'margin'.
+    """
+    best = -math.inf
+    for ring in (a, b):
+        for (ax, ay), (bx, by) in zip(ring[:-1], ring[1:]):
+            nx = ay - by
+            ny = bx - ax
+            pa = [nx * x + ny * y for x, y in a]
+            pb = [nx * x + ny * y for x, y in b]
+            gap = max(min(pb) - max(pa), min(pa) - max(pb))
+            gap /= math.hypot(nx, ny)
+            if gap > margin:
+                return gap
+            if gap > best:
+                best = gap
+    return best
+
+
+def _ring_edges(coords):
+    """Return the edges of a closed ring as plain coordinate tuples.
+
+    'coords' must be a sequence of plain (x, y) tuples forming a closed ring.
+    The result is a tuple of (ax, ay, bx, by, low, high) tuples, one for each
+    edge, where 'low' and 'high' are the edge's lowest and highest y-values,
+    widened by more than float_close's tolerance at their magnitude.
+    Precomputing the vertical span lets the ray cast in _point_in_ring reject
+    most edges with two plain comparisons.
+    """
+    edges = []
+    for (ax, ay), (bx, by) in zip(coords[:-1], coords[1:]):
+        low, high = (ay, by) if ay < by else (by, ay)
+        edges.append((
+                ax, ay, bx, by,
+                low - 2 * (ABS_TOL + 1e-9 * abs(low)),
+                high + 2 * (ABS_TOL + 1e-9 * abs(high))))
+    return tuple(edges)
+
+
+def _ring_index(edges):
+    """Index the edges of a closed ring by height.
+
+    'edges' must be a sequence of edge tuples, as returned by _ring_edges.  The
+    ends of the edges' vertical spans divide the plane into horizontal slabs.
+    The result is a pair of (breaks, buckets), where 'breaks' is the sorted
+    list of slab boundaries, and buckets[i] holds every edge whose span meets
+    the slab from breaks[i] to breaks[i+1], including its boundaries.
+
+    A point at height y therefore only needs to visit the edges in
+    buckets[bisect_right(breaks, y) - 1], or none at all if y is below the
+    first break.
+    """
+    breaks = sorted({span for edge in edges for span in edge[4:]})
+    buckets = [[] for _ in breaks]
+    for edge in edges:
+        low = bisect_left(breaks, edge[4])
+        high = bisect_left(breaks, edge[5])
+        for i in range(low, high + 1):
+            buckets[i].append(edge)
+    return breaks, tuple(tuple(bucket) for bucket in buckets)
+
+
+def _index_lookup(index, y):
+    """Return the edges from a _ring_index that a point at height 'y' needs to
+    visit.
+    """
+    breaks, buckets = index
+    i = bisect_right(breaks, y) - 1
+    return buckets[i] if i >= 0 else ()
+
+
+def _edge_tree(edges):
+    """Bulk-load a tree of bounding boxes over the edges of a ring.
+
+    'edges' must be a sequence of edge tuples, as returned by _ring_edges.  The
+    tree is packed bottom-up using the Sort-Tile-Recursive method, with up to
+    TREE_NODE_SIZE children per node.  Each node is a tuple of (min_x, min_y,
+    max_x, max_y, children), where the children of a leaf are edge indexes.
+
+    Query the tree with _tree_query.
+    """
+    return _box_tree([
+            (min(ax, bx), min(ay, by), max(ax, bx), max(ay, by))
+            for ax, ay, bx, by, _, _ in edges])
+
+
+def _box_tree(boxes):
+    """Bulk-load a tree over a non-empty sequence of bounding boxes.
+
+    Each box must be a tuple of (min_x, min_y, max_x, max_y).  The tree is
+    built as described for _edge_tree, except that the children of a leaf are
+    indexes into 'boxes'.
+    """
+    nodes = [(*box, i) for i, box in enumerate(boxes)]
+    while True:
+        nodes = _pack_nodes(nodes)
+        if len(nodes) == 1:
+            return nodes[0]
+
+
+def _pack_nodes(nodes):
+    """Group tree nodes under parent nodes, for _box_tree.
+
+    The nodes are sorted into vertical slices by the x-value of their centres,
+    and then each slice is cut into runs of TREE_NODE_SIZE by the y-value of
+    their centres, so that each parent covers a compact area.
+    """
+    size = TREE_NODE_SIZE
+    parents = math.ceil(len(nodes) / size)
+    step = math.ceil(math.sqrt(parents)) * size
+    nodes = sorted(nodes, key=lambda n: n[0] + n[2])
+    result = []
+    for i in range(0, len(nodes), step):
+        column = sorted(nodes[i:i+step], key=lambda n: n[1] + n[3])
+        for j in range(0, len(column), size):
+            group = tuple(column[j:j+size])
+            result.append((
+                    min(n[0] for n in group),
+                    min(n[1] for n in group),
+                    max(n[2] for n in group),
+                    max(n[3] for n in group),
+                    group))
+    return result
+
+
+def _tree_query(tree, min_x, min_y, max_x, max_y):
+    """Return the indexes of edges in the tree that might meet the given box.
+
+    The result includes every edge whose bounding box is within tolerance of
+    the box, in no particular order.  The tolerance is at least as wide as the
+    one float_lt and float_gt allow, so any pair of edges that
+    _segments_intersect could accept will be found.  The same goes for a tree
+    from _box_tree, with the boxes in place of the edges.
+    """
+    magnitude = max(
+            abs(min_x), abs(min_y), abs(max_x), abs(max_y),
+            abs(tree[0]), abs(tree[1]), abs(tree[2]), abs(tree[3]))
+    pad = max(ABS_TOL, 1e-9 * magnitude)
+    min_x -= pad
+    min_y -= pad
+    max_x += pad
+    max_y += pad
+
+    result = []
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if (
+                node[0] > max_x or node[2] < min_x or
+                node[1] > max_y or node[3] < min_y):
+            continue
+        children = node[4]
+        if isinstance(children, int):
+            result.append(children)
+        else:
+            stack.extend(children)
+    return result
+
+
+def _validate_ring(edges):
+    """Check that the edges of a closed ring form a valid polygon boundary.
+
+    'edges' must be a tuple of edge tuples, as returned by _ring_edges.  Raise
+    ValueError if the ring backtracks along itself, or if any of its edges
+    intersect with any other edge that isn't adjacent to it.
+
+    Most rings are valid, so they are first checked with _ring_is_simple,
+    which sweeps across the ring in O(n log n) for typical shapes.  Only if
+    that finds a fault are the edges searched in order, to report the first
+    one.  Comparing every pair of edges is O(n²), so for larger rings, each
+    edge is only compared against the edges found near it in an _edge_tree.
+    """
+    if _ring_is_simple(edges):
+        return
+    length = len(edges)
+    tree = _edge_tree(edges) if length >= INDEX_MIN_EDGES else None
+    for i in range(length - 1):
+        ax, ay, bx, by = edges[i][:4]
+        cx, cy = edges[i+1][2:4]
+
+        # Disallow backtracking along the same line.  The next edge backtracks
+        # if it is collinear with this one, and heads in the opposite
+        # direction.
+        ux, uy = bx - ax, by - ay
+        vx, vy = cx - bx, cy - by
+        if ux * vy - uy * vx == 0 and ux * vx + uy * vy < 0:
+            raise ValueError(
+                    f"Line {Line((bx, by), (cx, cy))} backtracks "
+                    "along the previous line.")
+
+        # Disallow self-intersection.  Each pair only needs testing once, and
+        # adjacent edges always share a vertex, so start two edges along.  The
+        # first and last edges are also adjacent, as they meet at the start
+        # point.
+        end = length - 1 if i == 0 else length
+        if tree is None:
+            others = range(i + 2, end)
+        else:
+            found = _tree_query(
+                    tree, min(ax, bx), min(ay, by), max(ax, bx), max(ay, by))
+            others = sorted(j for j in found if i + 2 <= j < end)
+        for j in others:
+            if _segments_intersect(*edges[i][:4], *edges[j][:4]):
+                a = Line(edges[i][:2], edges[i][2:4])
+                b = Line(edges[j][:2], edges[j][2:4])
+                raise ValueError(f"Line {a} intersects with {b}.")
+
+
+def _ring_is_simple(edges):
+    """Return whether a closed ring neither backtracks nor intersects itself.
+
+    'edges' must be a tuple of edge tuples, as returned by _ring_edges.  This
+    gives the same answer as _validate_ring, without finding out which edges
+    are at fault.
+
+    The edges are swept across in order of where their bounding boxes begin,
+    along whichever axis the edges are narrower on.  Each edge is only tested
+    against the edges whose boxes the sweep is still within, and only if
+    their boxes also overlap on the other axis.  The boxes are padded by at
+    least the tolerance _tree_query allows, so no pair that
+    _segments_intersect could accept is missed.
+    """
+    length = len(edges)
+    for i in range(length - 1):
+        ax, ay, bx, by = edges[i][:4]
+        cx, cy = edges[i+1][2:4]
+        ux, uy = bx - ax, by - ay
+        vx, vy = cx - bx, cy - by
+        if ux * vy - uy * vx == 0 and ux * vx + uy * vy < 0:
+            return False
+
+    # Each box is (sweep low, sweep high, cross low, cross high).
+    boxes = [
+            (min(ax, bx), max(ax, bx), min(ay, by), max(ay, by))
+            for ax, ay, bx, by, _, _ in edges]
+    min_x = min(box[0] for box in boxes)
+    max_x = max(box[1] for box in boxes)
+    min_y = min(box[2] for box in boxes)
+    max_y = max(box[3] for box in boxes)
+    span_x = sum(box[1] - box[0] for box in boxes)
+    span_y = sum(box[3] - box[2] for box in boxes)
+    if span_x * (max_y - min_y) > span_y * (max_x - min_x):
+        boxes = [(box[2], box[3], box[0], box[1]) for box in boxes]
+    magnitude = max(abs(min_x), abs(min_y), abs(max_x), abs(max_y))
+    pad = 2 * max(ABS_TOL, 1e-9 * magnitude)
+
+    last = length - 1
+    active = []
+    for i in sorted(range(length), key=boxes.__getitem__):
+        low, high, cross_low, cross_high = boxes[i]
+        low -= pad
+        active = [j for j in active if boxes[j][1] >= low]
+        for j in active:
+            box = boxes[j]
+            if box[2] > cross_high + pad or box[3] < cross_low - pad:
+                continue
+            # Adjacent edges share a vertex, including the first and last.
+            if abs(i - j) in (1, last):
+                continue
+            if _segments_intersect(*edges[i][:4], *edges[j][:4]):
+                return False
+        active.append(i)
+    return True
+
+
+def _point_in_ring(edges, px, py, exact):
+    """Return whether the point (px, py) lies inside a closed linear ring.
+
+    'edges' must be a sequence of edge tuples, as returned by _ring_edges.
+    Return True if the point is inside the ring, False if it is outside, or the
+    value of 'exact' if it lies on the boundary.
+
+    Inside means that the ring winds around the point a non-zero number of
+    times.  For a simple ring, this is the same as the point being enclosed.
+    For a self-intersecting ring, regions the ring winds around more than once
+    are inside too.
+    """
+    # The range checks below compare against a padding worked out once,
+    # rather than calling float_lt and float_gt, as they run for every edge.
+    # The padding is wider than float_close's tolerance at px.
+    pad = 2 * (ABS_TOL + 1e-9 * abs(px))
+    winding = 0
+    for ax, ay, bx, by, low, high in edges:
+        # Shortcut: an edge that lies entirely above or below the point can
+        # neither have the point on it, nor cross the point's horizontal.  The
+        # edge's span is already widened by the tolerance.
+        if py < low or py > high:
+            continue
+
+        # Check for the point lying on this edge, by the same test as
+        # Line.intersects_point.
+        low, high = (ax, bx) if ax < bx else (bx, ax)
+        if low - pad <= px <= high + pad:
+            if _on_segment(ax, ay, bx, by, px, py):
+                return exact
+
+        # Wind around the edges crossed by a ray cast from the point towards
+        # positive x, counting upward crossings as +1 and downward as -1.  The
+        # edge crosses the ray if it spans the point's horizontal and the
+        # point lies to its left, which is the sign of the cross product taken
+        # relative to the edge direction.  This saves dividing to find where
+        # the edge meets the horizontal.  A lookup table of winding deltas
+        # indexed by these comparisons was tried, but in Python the indexing
+        # costs more than the branches it replaces.
+        if (ay > py) != (by > py):
+            upward = by > ay
+            cross = (ax - px) * (by - py) - (bx - px) * (ay - py)
+            if (cross > 0) == upward:
+                winding += 1 if upward else -1
+    return winding != 0
+
+
+def _point_in_coords(coords, px, py, exact):
+    """Return whether the point (px, py) lies inside a closed linear ring.
+
+    This is the same test as _point_in_ring, with the same result, but walks a
+    sequence of coordinate pairs directly.  For a one-off query, that saves
+    building the edge tuples first, which would cost more than the test.
+    """
+    pad_x = 2 * (ABS_TOL + 1e-9 * abs(px))
+    pad_y = 2 * (ABS_TOL + 1e-9 * abs(py))
+    winding = 0
+    it = iter(coords)
+    a = next(it)
+    ax, ay = a[0], a[1]
+    for b in it:
+        bx, by = b[0], b[1]
+        low, high = (ay, by) if ay < by else (by, ay)
+        if py < low - pad_y or py > high + pad_y:
+            ax, ay = bx, by
+            continue
+
+        low, high = (ax, bx) if ax < bx else (bx, ax)
+        if low - pad_x <= px <= high + pad_x:
+            if _on_segment(ax, ay, bx, by, px, py):
+                return exact
+
+        if (ay > py) != (by > py):
+            upward = by > ay
+            cross = (ax - px) * (by - py) - (bx - px) * (ay - py)
+            if (cross > 0) == upward:
+                winding += 1 if upward else -1
+        ax, ay = bx, by
+    return winding != 0
+
+
+def _point_in_convex_ring(coords, px, py):
+    """Return whether the point (px, py) lies inside a convex ring.
+
+    'coords' must be a sequence of plain (x, y) tuples forming a closed,
+    convex, clockwise ring.  The ring is treated as a fan of triangles around
+    its first vertex, and a binary search finds the triangle whose wedge holds
+    the point, so this only needs O(log n) orientation tests.
+
+    Return True if the point is inside the ring, or False if it is outside or
+    on the boundary.  Return None if the point lies on, or close to, one of
+    the lines tested, in which case the caller should fall back to
+    _point_in_ring to classify it.
+    """
+    x0, y0 = coords[0]
+    last = len(coords) - 2
+    first_side = _orientation(x0, y0, *coords[1], px, py)
+    last_side = _orientation(x0, y0, *coords[last], px, py)
+    if first_side == 0 or last_side == 0:
+        return None
+    if first_side < 0 or last_side > 0:
+        # Outside the wedge between the first and last edges.
+        return False
+
+    # Find the pair of consecutive vertices whose rays from the first vertex
+    # have the point between them.
+    low = 1
+    high = last
+    while high - low > 1:
+        mid = (low + high) // 2
+        side = _orientation(x0, y0, *coords[mid], px, py)
+        if side == 0:
+            return None
+        if side > 0:
+            low = mid
+        else:
+            high = mid
+
+    ax, ay = coords[low]
+    bx, by = coords[high]
+    side = _orientation(ax, ay, bx, by, px, py)
+    if side == 0:
+        return None
+    if side < 0:
+        return False
+
+    # The point is inside the triangle (first, low, high), but might still be
+    # close enough to an edge of the ring to be on the boundary by
+    # _on_segment.  Any such edge is either a side of this triangle, or lies
+    # beyond one, so it is enough to check the point's distance from the
+    # triangle's three sides.  The allowance covers _on_segment's vertical
+    # tolerance plus the corners of its bounding box test.
+    tol = 4 * (ABS_TOL + 1e-9 * max(abs(px), abs(py)))
+    sides = ((x0, y0, ax, ay), (x0, y0, bx, by), (ax, ay, bx, by))
+    for cx, cy, dx, dy in sides:
+        cdx = dx - cx
+        cdy = dy - cy
+        cross = cdx * (py - cy) - cdy * (px - cx)
+        if cross * cross <= (cdx * cdx + cdy * cdy) * tol * tol:
+            return None
+    return True
+
+
 def in_bound(a, b, p):
-    return Line(a, b).in_bound(p)
+    """Return whether point 'p' lies within the boundary of the line (a, b).
+
+    This is the same test as Line.in_bound, but operates directly on
+    coordinate pairs without constructing any Line or Point objects.
+    """
+    return _in_bound(a[0], a[1], b[0], b[1], p[0], p[1])
+
+
+def _in_bound(ax, ay, bx, by, px, py):
+    """Return the result of in_bound for plain coordinates."""
+    if float_close(ax, bx) and float_close(ay, by):
+        raise ValueError("Invalid line: the two points are too close.")
+    # The same cross product test as _orientation, inlined to go straight to
+    # the result.
+    abx = bx - ax
+    aby = by - ay
+    apx = px - ax
+    apy = py - ay
+    cross = abx * apy - aby * apx
+    scale = (abx * abx + aby * aby) * (apx * apx + apy * apy)
+    if cross * cross <= scale * ABS_TOL * ABS_TOL:
+        return None
+    return cross < 0
 
 
 def get_intercept_h(a, b, y):
@@ -2072,7 +2997,11 @@ def get_intercept_h(a, b, y):
 
     Return None if the line between 'a' and 'b' is itself horizontal.
     """
-    return Line(a, b).get_y_intercept(y)
+    ax, ay = a[0], a[1]
+    bx, by = b[0], b[1]
+    if float_close(ax, bx) and float_close(ay, by):
+        raise ValueError("Invalid line: the two points are too close.")
+    return _x_at(ax, ay, bx, by, y)
 
 
 def get_intercept_v(a, b, x):
@@ -2084,7 +3013,11 @@ def get_intercept_v(a, b, x):
 
     Return None if the line between 'a' and 'b' is itself vertical.
     """
-    return Line(a, b).get_x_intercept(x)
+    ax, ay = a[0], a[1]
+    bx, by = b[0], b[1]
+    if float_close(ax, bx) and float_close(ay, by):
+        raise ValueError("Invalid line: the two points are too close.")
+    return _y_at(ax, ay, bx, by, x)
 
 
 def get_adjacent_line(a, b, angle, length):
@@ -2100,7 +3033,7 @@ def get_adjacent_line(a, b, angle, length):
 
 def get_polygon_lines(poly):
     """Return an iterable of all line segments in the polygon."""
-    return [(poly[i], poly[i+1]) for i in range(len(poly) - 1)]
+    return list(zip(poly[:-1], poly[1:]))
 
 
 def is_convex(poly):
@@ -2111,14 +3044,72 @@ def is_convex(poly):
     side.
 
     The polygon is considered convex if no point lies on the left-hand side of
-    the line formed by the preceding two points.
+    the line formed by the preceding two points.  If the ring is closed, that
+    includes the turn at the start point, between the last edge and the first.
+    A Polygon's convexity is worked out when it is built, and returned as-is.
+    """
+    if isinstance(poly, Polygon):
+        return poly._convex
+    return _is_convex(*_columns(poly))
+
+
+def _is_convex(xs, ys):
+    """Return whether a ring is convex, given its columns of x and y values.
+
+    This is the test behind is_convex, and accepts the same rings, open or
+    closed.
     """
-    for i in range(0, len(poly) - 2):
-        if in_bound(poly[i], poly[i+1], poly[i+2]) is False:
+    if len(xs) > 2 and xs[0] == xs[-1] and ys[0] == ys[-1]:
+        xs = xs + xs[1:2]
+        ys = ys + ys[1:2]
+    if len(xs) < 3:
+        return True
+
+    # A left turn between two consecutive edges shows up as a positive cross
+    # product.  As in _orientation, near-zero values are treated as collinear.
+    # Each edge is worked out as the walk reaches it, and carried over to the
+    # next turn.
+    tolerance = ABS_TOL * ABS_TOL
+    ux = xs[1] - xs[0]
+    uy = ys[1] - ys[0]
+    for ax, ay, bx, by in zip(xs[1:], ys[1:], xs[2:], ys[2:]):
+        vx = bx - ax
+        vy = by - ay
+        cross = ux * vy - uy * vx
+        if cross > 0 and (
+                cross * cross >
+                tolerance * (ux * ux + uy * uy) * (vx * vx + vy * vy)):
             return False
+        ux = vx
+        uy = vy
     return True
 
 
+def signed_area(poly):
+    """Return the signed area of a polygon.
+
+    The polygon must be given as a sequence of points forming a closed linear
+    ring.  The magnitude of the result is the area enclosed by the ring, and
+    its sign gives the winding direction: negative for a clockwise ring, and
+    positive for a counter-clockwise ring.
+
+    This is the 'shoelace' formula, which needs only a single pass over the
+    vertices.
+    """
+    if isinstance(poly, Polygon):
+        return poly._signed_area()
+    return _shoelace(*_columns(poly))
+
+
+def _shoelace(xs, ys):
+    """Return the signed area of a ring, given its columns of x and y values.
+    """
+    total = (
+            sum(x * y for x, y in zip(xs[:-1], ys[1:])) -
+            sum(x * y for x, y in zip(xs[1:], ys[:-1])))
+    return total / 2
+
+
 def divide_polygon(poly, i, j):
     """Divide a polygon along an internal line between two of its vertices.
 
@@ -2132,7 +3123,8 @@ def divide_polygon(poly, i, j):
     points lies internal to the polygon.  Results are not guaranteed to be
     sensible if the line is external!
 
-    Returns a tuple of two distinct polygons that share an edge.
+    Returns a tuple of two distinct polygons that share an edge, each as a
+    list of points.
     """
     if i > j:
         i, j = j, i
@@ -2152,8 +3144,10 @@ def divide_polygon(poly, i, j):
                 "Invalid indices for divide polygon: "
                 "must not specify adjacent points.")
 
-    a = poly[i:j+1] + [poly[i]]
-    b = poly[:i+1] + poly[j:]
+    # Build each ring as a single list straight from the slices, which also
+    # lets 'poly' be any sequence of points, not just a list.
+    a = [*poly[i:j+1], poly[i]]
+    b = [*poly[:i+1], *poly[j:]]
     return (a, b)
 
 
@@ -2161,7 +3155,10 @@ def shift_polygon(poly, n):
     """Shift the starting point of a polygon.
 
     Return a new polygon that has the same boundary as the input polygon, but a
-    starting point shifted clockwise by 'n' positions.
+    starting point shifted clockwise by 'n' positions.  The result is built by
+    slicing, so it is the same kind of sequence as a slice of the input: a list
+    for a list, or a tuple for a tuple or a Polygon, sharing the input's
+    vertices rather than copying them.
     """
     length = len(poly) - 1
     n = n % length
@@ -2175,16 +3172,222 @@ def _find_next_convex_point(poly, i):
     the next point that will yield a convex shape with the line segment
     beginning at 'i'.
     """
-    shift = shift_polygon(poly, i)
-    length = len(poly)
-    for j in range(2, length):
-        if not in_bound(shift[0], shift[1], shift[j]) is False:
-            return (j + i) % (length - 1)
+    coords = _coords(poly)
+    ring = len(coords) - 1
+    ax, ay = coords[i % ring]
+    bx, by = coords[(i + 1) % ring]
+    for j in range(2, len(coords)):
+        px, py = coords[(i + j) % ring]
+        if _orientation(ax, ay, bx, by, px, py) >= 0:
+            return (i + j) % ring
     return None
 
 
 def point_in_polygon(poly, point, exact=True):
-    return Polygon(poly).contains_point(point, exact)
+    """Return whether a point lies inside a polygon.
+
+    The polygon must be given as a sequence of points forming a closed linear
+    ring.  If the point lies inside the polygon, return True.  If it lies
+    outside, return False.  If it lies exactly on the boundary, return the
+    value of the 'exact' argument.
+
+    This operates directly on the coordinates, using the winding number
+    algorithm, and does not construct or validate a Polygon.  If the ring
+    intersects itself, any region it winds around is inside (the "non-zero"
+    rule).  If 'poly' is already a Polygon, its precomputed edges are used
+    as-is, along with its edge index if it has enough edges to warrant one.
+
+    A point is on the boundary if it is on one of the edges by the same test
+    as Line.intersects_point, that is, within float_close's tolerance of it.
+    Otherwise, the winding test only multiplies and subtracts coordinates,
+    never divides them, so integer coordinates are worked exactly.
+
+    To test many points against the same polygon, use points_in_polygon, or
+    points_in_grid for a grid of points, which only do the setup once.
+    """
+    x, y = point[0], point[1]
+    if isinstance(poly, Polygon):
+        # Shortcut: a point well outside the bounding box is outside the
+        # polygon.  Anything within tolerance of the box is left for the ray
+        # cast to classify.
+        min_x, min_y, max_x, max_y = poly._bbox.as_tuple()
+        pad_x = 2 * (ABS_TOL + 1e-9 * max(abs(min_x), abs(max_x)))
+        pad_y = 2 * (ABS_TOL + 1e-9 * max(abs(min_y), abs(max_y)))
+        if (
+                x < min_x - pad_x or x > max_x + pad_x or
+                y < min_y - pad_y or y > max_y + pad_y):
+            return False
+        inside = _point_in_ring(poly._edges_at(y), x, y, exact)
+    else:
+        inside = _point_in_coords(poly, x, y, exact)
+    if inside and not exact:
+        # A point inside the polygon must also be contained by its bounding
+        # box, as for Polygon.contains_point.  That only fails for a point
+        # within float_close's relative tolerance of an extreme vertex, but
+        # not of the vertex's edges.
+        xs, ys = _columns(poly)
+        box = BoundingBox(min(xs), min(ys), max(xs), max(ys))
+        inside = box.contains_points([(x, y)])[0]
+    return inside
+
+
+def points_in_polygon(poly, points, exact=True):
+    """Return whether each of a number of points lies inside a polygon.
+
+    This is the batch form of point_in_polygon, and takes the same arguments,
+    except that 'points' is a sequence of points.  The result is a list of
+    booleans, one for each point, in the same order.
+
+    The polygon's edges and bounding box are worked out once for the whole
+    batch, and points that the bounding box rules out are rejected without
+    casting a ray.  For a polygon with many edges, the edges are also indexed
+    by height, so that each ray only visits the edges at its own height.  A
+    Polygon keeps its index from one call to the next; for any other
+    sequence, the index is built once the batch has cast as many rays as the
+    ring has edges, by which point it has paid for itself.
+    """
+    if isinstance(poly, Polygon):
+        edges = None
+        xs, ys = poly._xs, poly._ys
+    else:
+        coords = _coords(poly)
+        edges = _ring_edges(coords)
+        xs = [x for x, _ in coords]
+        ys = [y for _, y in coords]
+    min_x, min_y, max_x, max_y = min(xs), min(ys), max(xs), max(ys)
+    points = [(p[0], p[1]) for p in points]
+    if exact:
+        # Shortcut: a point outside the bounding box, by more than
+        # float_close's tolerance, can't be on the boundary either.  Anything
+        # nearer is left for the ray cast to classify.
+        pad_x = 2 * (ABS_TOL + 1e-9 * max(abs(min_x), abs(max_x)))
+        pad_y = 2 * (ABS_TOL + 1e-9 * max(abs(min_y), abs(max_y)))
+        min_x, max_x = min_x - pad_x, max_x + pad_x
+        min_y, max_y = min_y - pad_y, max_y + pad_y
+        candidates = [
+                min_x <= x <= max_x and min_y <= y <= max_y
+                for x, y in points]
+    else:
+        # Shortcut: a point inside the polygon must be contained by the
+        # bounding box, by the same test as Polygon.contains_point.
+        box = BoundingBox(min_x, min_y, max_x, max_y)
+        candidates = box.contains_points(points)
+
+    index = None
+    cast = 0
+    result = []
+    for (x, y), candidate in zip(points, candidates):
+        if not candidate:
+            result.append(False)
+            continue
+        if edges is None:
+            ring = poly._edges_at(y)
+        elif index is not None:
+            ring = _index_lookup(index, y)
+        else:
+            ring = edges
+            cast += 1
+            if cast >= len(edges) >= INDEX_MIN_EDGES:
+                index = _ring_index(edges)
+        result.append(_point_in_ring(ring, x, y, exact))
+    return result
+
+
+def points_in_grid(poly, xs, ys, exact=True):
+    """Return whether each point of a grid lies inside a polygon.
+
+    The grid is made up of every combination of an x-value from 'xs' with a
+    y-value from 'ys'.  The result is a list of rows, one for each value in
+    'ys', and each row is a list of booleans, one for each value in 'xs', in
+    the same order.  The answers are the same as points_in_polygon would give
+    for each point, and 'exact' has the same meaning.
+
+    Each row works out where the polygon's edges cross it once, and then
+    classifies its points with a binary search, rather than testing every
+    point against every edge.
+    """
+    if isinstance(poly, Polygon):
+        edges_at = poly._edges_at
+    else:
+        edges = _ring_edges(_coords(poly))
+
+        def edges_at(y):
+            return edges
+
+    xs = list(xs)
+    if exact:
+        return [_grid_row(edges_at(y), xs, y, exact) for y in ys]
+
+    # A point inside the polygon must also be contained by its bounding box,
+    # by the same test as Polygon.contains_point, which splits into a test
+    # on each column and each row.
+    vertex_xs, vertex_ys = _columns(poly)
+    min_x, max_x = min(vertex_xs), max(vertex_xs)
+    min_y, max_y = min(vertex_ys), max(vertex_ys)
+    columns = [float_gt(x, min_x) and float_lt(x, max_x) for x in xs]
+    result = []
+    for y in ys:
+        if float_gt(y, min_y) and float_lt(y, max_y):
+            row = _grid_row(edges_at(y), xs, y, exact)
+            result.append([a and b for a, b in zip(row, columns)])
+        else:
+            result.append([False] * len(xs))
+    return result
+
+
+def _grid_row(edges, xs, y, exact):
+    """Return whether each point (x, y) lies inside a ring, for x in 'xs'.
+
+    'edges' must be a sequence of edge tuples, as returned by _ring_edges.
+    Points close enough to an edge that the ray cast might find them on the
+    boundary are passed to _point_in_ring, as is the whole row if an edge
+    touches it without crossing it.
+    """
+    crossings = []
+    margin = 0.0
+    for ax, ay, bx, by, low, high in edges:
+        if y < low or y > high:
+            continue
+        if (ay > y) == (by > y):
+            # The edge runs along the row, or ends on it, so points anywhere
+            # along the row could be on the boundary.
+            return [_point_in_ring(edges, x, y, exact) for x in xs]
+        dx = bx - ax
+        dy = by - ay
+        if abs(dy) <= 2 * ABS_TOL * math.hypot(dx, dy):
+            # Nearly flat, so the same goes for this edge.
+            return [_point_in_ring(edges, x, y, exact) for x in xs]
+        crossings.append((_x_at(ax, ay, bx, by, y), 1 if dy > 0 else -1))
+
+        # _on_segment allows a point to be off the edge's y-value by up to
+        # float_close's tolerance, which is this many times further from
+        # where the edge crosses the row.  Double it to allow for rounding.
+        margin = max(margin, 2 * abs(dx / dy))
+
+    if not crossings:
+        return [False] * len(xs)
+    crossings.sort()
+    places = [x for x, _ in crossings]
+    # Scale up by the tolerance in y, and add the tolerance in x for the
+    # points near a vertical edge.
+    margin = (
+            margin * 2 * (ABS_TOL + 1e-9 * abs(y)) +
+            2 * (ABS_TOL + 1e-9 * max(abs(places[0]), abs(places[-1]))))
+
+    # The ray cast from a point counts the crossings to its right, so keep a
+    # running total of the winding from the right-hand end of the row.
+    winding = [0] * (len(crossings) + 1)
+    for i in range(len(crossings) - 1, -1, -1):
+        winding[i] = winding[i + 1] + crossings[i][1]
+
+    result = []
+    for x in xs:
+        i = bisect_left(places, x - margin)
+        if i < len(places) and places[i] <= x + margin:
+            result.append(_point_in_ring(edges, x, y, exact))
+        else:
+            result.append(winding[i] != 0)
+    return result
 
 
 def _union2(a:Geometry, b:Geometry) -> Geometry:
@@ -2312,29 +3515,20 @@ def regular_polygon(center:Point, sides:int, radius=None, side_length=None) -> P
             Point(c.x - radius, c.y))
         return Polygon(points)
 
-    # Now that we've got triangles and squares out of the way, it's safe to
-    # assume deflection angle less than 90 degrees.
-    if radius:
-        a = Point(c.x, c.y + radius)
-        # Work out bx and by relative to the center
-        bx = radius * math.sin(angle)
-        by = math.sqrt(radius**2 - bx**2)
-        b = Point(c.x + bx, c.y + by)
-        line = Line(a, b)
-        side_length = line.length
-    else:
-        # Work out bx and by relative to the start point
-        interior_angle = π - angle
-        bx = side_length * math.sin(interior_angle / 2)
-        by = math.sqrt(side_length**2 - bx**2)
-        radius = bx / math.sin(angle)
-        a = Point(c.x, c.y + radius)
-        b = Point(a.x + bx, a.y - by)
-        line = Line(a, b)
-    last = Point(c.x - bx, b.y)
-    points = [a, b]
-    for _ in range(sides - 3):
-        line = line.get_adjacent_line(-angle, side_length)
-        points.append(line.b)
-    points.append(last)
-    return Polygon(points)
+    # Place each vertex directly at its angle around the center, working
+    # clockwise from the top.  This avoids building a Line for each side, and
+    # keeps rounding errors from accumulating around the polygon.  Only the
+    # right-hand side is worked out, and the left is its mirror image, so the
+    # polygon is exactly symmetric.
+    if side_length:
+        radius = side_length / (2 * math.sin(π / sides))
+    right = []
+    for i in range(sides // 2 + 1):
+        turn, part = divmod(24 * i, sides)
+        if part == 0 and turn in EXACT_SIN_COS:
+            sin, cos = EXACT_SIN_COS[turn]
+        else:
+            sin, cos = math.sin(i * angle), math.cos(i * angle)
+        right.append((radius * sin, radius * cos))
+    left = [(-x, y) for x, y in reversed(right[1:(sides + 1) // 2])]
+    return Polygon([(c.x + x, c.y + y) for x, y in right + left])
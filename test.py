@@ -7,15 +7,61 @@ from geom import P, L, B, Pg, Co, MP, ML, MPg
 
 π = math.pi
 
+# A non-convex polygon, referred to in the tests as the "horseshoe".
+HORSESHOE = (
+        (1, 1),
+        (1, 6),
+        (2, 5),
+        (2, 2),
+        (4, 2),
+        (3, 4),
+        (5, 4),
+        (4, 0),
+        (1, 1),
+        )
+
+# Whether each point on the integer grid from (0, 0) to (6, 6) is contained by
+# the horseshoe, indexed as [y][x].
+HORSESHOE_CONTAINS = (
+        (False, False, False, False, False, False, False),
+        (False, False,  True,  True,  True, False, False),
+        (False, False, False, False, False, False, False),
+        (False, False, False, False,  True, False, False),
+        (False, False, False, False, False, False, False),
+        (False, False, False, False, False, False, False),
+        (False, False, False, False, False, False, False),
+        )
+
+
+def grid_points(expect):
+    """Return the (x, y) points for a grid of results indexed as [y][x].
+
+    The points are listed row by row, in the same order as flattening the grid.
+    """
+    return [(x, y) for y, row in enumerate(expect) for x in range(len(row))]
+
 
 class GeomTestCase(unittest.TestCase):
+    def assertCoordsAlmostEqual(self, first, second):
+        """Assert that two equal-length sequences of numbers are all equal to
+        7 decimal places, in the same manner as assertAlmostEqual.
+
+        The whole sequence is compared in one step, and any mismatch reports
+        both sequences in full.
+        """
+        if len(first) == len(second) and all(
+                a == b or round(abs(a - b), 7) == 0
+                for a, b in zip(first, second)):
+            return
+        self.fail(f"{first} != {second} within 7 places")
+
     def assertPointEqual(self, a, b):
-        self.assertAlmostEqual(a[0], b[0])
-        self.assertAlmostEqual(a[1], b[1])
+        self.assertCoordsAlmostEqual((a[0], a[1]), (b[0], b[1]))
 
     def assertLineEqual(self, a, b):
-        self.assertPointEqual(a.a, b.a)
-        self.assertPointEqual(a.b, b.b)
+        self.assertCoordsAlmostEqual(
+                (a.a[0], a.a[1], a.b[0], a.b[1]),
+                (b.a[0], b.a[1], b.b[0], b.b[1]))
 
 
 class TestPoint(GeomTestCase):
@@ -24,6 +70,12 @@ class TestPoint(GeomTestCase):
         self.assertEqual(P((1, 1)), P((1.0, 1.0)))
         self.assertNotEqual(P((1, 1)), P((1.0001, 1.0)))
         self.assertNotEqual(P((1, 1)), L((1, 1), (2, 2)))
+        self.assertNotEqual(P((1, 1)), B(1, 1, 2, 2))
+        self.assertNotEqual(P((1, 1)), None)
+        # Plain coordinate pairs compare as Points
+        self.assertEqual(P(1, 1), (1.0, 1.0))
+        self.assertEqual(P(1, 1), [1, 1])
+        self.assertNotEqual(P(1, 1), (1, 2))
 
     def test_equals_point(self):
         a = P((1, 1))
@@ -33,61 +85,24 @@ class TestPoint(GeomTestCase):
         self.assertFalse(f(P((1.0001, 1.0))))
         self.assertFalse(f(P((1, 2))))
 
-    def test_intersects_point(self):
-        a = P((1, 1))
-        f = a.intersects
-        self.assertTrue(f(P((1.0, 1.0))))
-        self.assertFalse(f(P((1.00001, 1.0))))
-        self.assertFalse(f(P((-1, -1))))
-
-    def test_disjoint_point(self):
-        a = P((1, 1))
-        f = a.disjoint
-        self.assertFalse(f(P((1.0, 1.0))))
-        self.assertTrue(f(P((1.00001, 1.0))))
-        self.assertTrue(f(P((-1, -1))))
-
-    def test_touches_point(self):
-        a = P((1, 1))
-        f = a.touches
-        self.assertFalse(f(P((1.0, 1.0))))
-        self.assertFalse(f(P((1.00001, 1.0))))
-        self.assertFalse(f(P((-1, -1))))
-
-    def test_crosses_point(self):
-        a = P((1, 1))
-        f = a.crosses
-        self.assertFalse(f(P((1.0, 1.0))))
-        self.assertFalse(f(P((1.00001, 1.0))))
-        self.assertFalse(f(P((-1, -1))))
-
-    def test_contains_point(self):
-        a = P((1, 1))
-        f = a.contains
-        self.assertTrue(f(P((1.0, 1.0))))
-        self.assertFalse(f(P((1.00001, 1.0))))
-        self.assertFalse(f(P((-1, -1))))
-
-    def test_covers_point(self):
-        a = P((1, 1))
-        f = a.covers
-        self.assertTrue(f(P((1.0, 1.0))))
-        self.assertFalse(f(P((1.00001, 1.0))))
-        self.assertFalse(f(P((-1, -1))))
-
-    def test_within_point(self):
-        a = P((1, 1))
-        f = a.within
-        self.assertTrue(f(P((1.0, 1.0))))
-        self.assertFalse(f(P((1.00001, 1.0))))
-        self.assertFalse(f(P((-1, -1))))
-
-    def test_overlaps_point(self):
+    def test_predicates_point(self):
         a = P((1, 1))
-        f = a.overlaps
-        self.assertFalse(f(P((1.0, 1.0))))
-        self.assertFalse(f(P((1.00001, 1.0))))
-        self.assertFalse(f(P((-1, -1))))
+        points = (P((1.0, 1.0)), P((1.00001, 1.0)), P((-1, -1)))
+        # Expected result of each predicate for each of the points above.
+        expect = {
+                'intersects': (True, False, False),
+                'disjoint': (False, True, True),
+                'touches': (False, False, False),
+                'crosses': (False, False, False),
+                'contains': (True, False, False),
+                'covers': (True, False, False),
+                'within': (True, False, False),
+                'overlaps': (False, False, False),
+                }
+        for name, values in expect.items():
+            f = getattr(a, name)
+            with self.subTest(predicate=name):
+                self.assertEqual(tuple(f(p) for p in points), values)
 
     def test_equals_line(self):
         a = P((1, 1))
@@ -622,6 +637,16 @@ class TestLine(GeomTestCase):
     def test_constructor(self):
         with self.assertRaises(ValueError):
             L((3, 5), (3.0, 5.0))
+        with self.assertRaises(ValueError):
+            L(P(3, 5), P(3, 5))
+
+        # Points are shared, not copied
+        a = P(1, 2)
+        b = P(3, 4)
+        line = L(a, b)
+        self.assertIs(line.a, a)
+        self.assertIs(line.b, b)
+        self.assertEqual((line.dx, line.dy), (2, 2))
 
     def test_angle(self):
         # Horizontal
@@ -638,6 +663,20 @@ class TestLine(GeomTestCase):
         self.assertAlmostEqual(L((0, 0), (1, -1)).angle, -π / 4)
         self.assertAlmostEqual(L((0, 0), (-1, -1)).angle, -3 * π / 4)
 
+    def test_neg(self):
+        for a, b in (
+                ((0.5, 1.5), (2.5, 1.5)),
+                ((1, 2), (1, -3)),
+                ((-1, 4), (2, 0.5))):
+            line = L(a, b)
+            neg = -line
+            expect = L(b, a)
+            self.assertEqual(neg, expect)
+            self.assertEqual(
+                    (neg.dx, neg.dy, neg.angle),
+                    (expect.dx, expect.dy, expect.angle))
+            self.assertEqual(-neg, line)
+
     def test_relative_angle(self):
         a = L((0, 0), (1, 0))
         # Horizontal
@@ -695,6 +734,13 @@ class TestLine(GeomTestCase):
         self.assertTrue(line.in_bound(P(-3, 2)))
         self.assertFalse(line.in_bound(P(0, 2)))
 
+        # The module function takes any kind of coordinate pairs
+        f = geom.in_bound
+        self.assertTrue(f((-1, 2), (-4, 1), (-3, 2)))
+        self.assertTrue(f([-1, 2], [-4, 1], P(-3, 2)))
+        self.assertFalse(f(P(-1, 2), (-4, 1), [0, 2]))
+        self.assertIsNone(f((1, 2), (4, 1), (3, 4/3)))
+
     def test_intersects_h(self):
         self.assertTrue(L((0, 0), (2, 2)).intersects_y(1))
         self.assertTrue(L((2, 2), (0, 0)).intersects_y(1))
@@ -800,12 +846,16 @@ class TestLine(GeomTestCase):
         f = line.intersects
         self.assertTrue(f(P(3, 3.5)))
         self.assertFalse(f(P(4, 3)))
+        self.assertFalse(f(P(3, 4.5)))
+        self.assertTrue(f(P(3 + 1e-9, 4 + 1e-9)))
 
         # Horizontal
         line = L((-2, -2), (2, -2))
         f = line.intersects
         self.assertTrue(f(P(0, -2)))
         self.assertFalse(f(P(0, -1.999)))
+        self.assertFalse(f(P(-3, -2)))
+        self.assertTrue(f(P(-2 - 1e-9, -2)))
 
         # Other
         line = L((0, 0), (2, 2))
@@ -863,6 +913,7 @@ class TestLine(GeomTestCase):
         self.assertTrue(f(L((3, 3), (4, 4))))
         self.assertTrue(f(L((0, 1), (5, 6))))
         self.assertTrue(f(L((3, 4), (3, 6))))
+        self.assertTrue(f(L((3, 1), (3, 7))))
 
         # Horizontal
         a = L((3, 3), (-1, 3))
@@ -872,6 +923,7 @@ class TestLine(GeomTestCase):
         self.assertTrue(f(L((3, 3), (4, 4))))
         self.assertTrue(f(L((0, 0), (1, 5))))
         self.assertTrue(f(L((0, 3), (1, 3))))
+        self.assertTrue(f(L((5, 3), (-2, 3))))
 
         # Other
         a = L((0, 3), (4, 0))
@@ -881,6 +933,7 @@ class TestLine(GeomTestCase):
         self.assertTrue(f(L((0, 0), (5, 5))))
         self.assertTrue(f(L((4, 0), (-2, 1))))
         self.assertTrue(f(L((2, 1.5), (-2, 4.5))))
+        self.assertTrue(f(L((-4, 6), (8, -3))))
 
     def test_disjoint_line(self):
         # Vertical
@@ -1286,33 +1339,46 @@ class TestBoundingBox(GeomTestCase):
         f = bbox.intersects
 
         # Points
-        self.assertFalse(f(P(11, 0)))
-        self.assertFalse(f(P(-1, 0)))
-        self.assertFalse(f(P(1, -1)))
-        self.assertFalse(f(P(1, 6)))
-
-        self.assertTrue(f(P(3, 3)))
-        self.assertTrue(f(P(0, 0)))
-        self.assertTrue(f(P(0, 1)))
-        self.assertTrue(f(P(0, 5)))
-        self.assertTrue(f(P(5, 5)))
-        self.assertTrue(f(P(10, 5)))
-        self.assertTrue(f(P(10, 2)))
-        self.assertTrue(f(P(10, 0)))
-        self.assertTrue(f(P(9, 0)))
-
-        # Lines:
-        # - External
-        self.assertFalse(f(L((11, 0), (11, 5))))
-        # - Internal
-        self.assertTrue(f(L((1, 1), (4, 3))))
-        # - Overlapping
-        self.assertTrue(f(L((-7, 4), (12, 4))))
-        # - Boundary
-        self.assertTrue(f(L((0, 0), (0, 5))))
-        self.assertTrue(f(L((10, 4), (10, 6))))
-        # - Corner
-        self.assertTrue(f(L((9, -1), (11, 1))))
+        cases = (
+                # External
+                ((11, 0), False),
+                ((-1, 0), False),
+                ((1, -1), False),
+                ((1, 6), False),
+                # Internal
+                ((3, 3), True),
+                # Boundary
+                ((0, 0), True),
+                ((0, 1), True),
+                ((0, 5), True),
+                ((5, 5), True),
+                ((10, 5), True),
+                ((10, 2), True),
+                ((10, 0), True),
+                ((9, 0), True),
+                )
+        self.assertEqual(
+                [f(P(p)) for p, _ in cases],
+                [value for _, value in cases])
+
+        # Lines
+        cases = (
+                # External
+                (L((11, 0), (11, 5)), False),
+                # Internal
+                (L((1, 1), (4, 3)), True),
+                # Overlapping
+                (L((-7, 4), (12, 4)), True),
+                # Boundary
+                (L((0, 0), (0, 5)), True),
+                (L((10, 4), (10, 6)), True),
+                # Corner
+                (L((9, -1), (11, 1)), True),
+                )
+        lines = [line for line, _ in cases]
+        expect = [value for _, value in cases]
+        self.assertEqual([f(line) for line in lines], expect)
+        self.assertEqual(bbox.intersects_segments(lines), expect)
 
         # Polygons:
         poly = Pg([(0, 6), (0, 9), (4, 6), (0, 6)])
@@ -1334,6 +1400,42 @@ class TestBoundingBox(GeomTestCase):
         poly = poly.move(0, 4)
         self.assertTrue(f(poly))
 
+    def test_contains_points(self):
+        bbox = B(-2, -7/3, 3.1, 6)
+        points = [(x, y) for y in range(-3, 8) for x in range(-3, 5)]
+        expect = [bbox.contains(P(p)) for p in points]
+        self.assertEqual(bbox.contains_points(points), expect)
+        self.assertEqual(bbox.contains_points([]), [])
+        self.assertEqual(
+                bbox.contains_points([P(0, 0), P(0, 6), P(12, -8)]),
+                [True, False, False])
+
+        # Points within tolerance of the boundary are not contained, even far
+        # from the origin.
+        bbox = B(1e6, 1e6, 2e6, 2e6)
+        points = [(1e6 + 1e-4, 1.5e6), (1.5e6, 2e6 - 1e-4), (1e6 + 1, 1.5e6)]
+        self.assertEqual(bbox.contains_points(points), [False, False, True])
+
+    def test_intersects_segments(self):
+        bbox = B(0, 0, 10, 5)
+        lines = [
+                L((11, 0), (11, 5)),
+                L((1, 1), (4, 3)),
+                L((-7, 4), (12, 4)),
+                L((0, 0), (0, 5)),
+                L((10, 4), (10, 6)),
+                L((9, -1), (11, 1)),
+                L((-1, 3), (3, 7)),
+                L((-1, 7), (3, 5.5)),
+                ]
+        expect = [bbox.intersects(line) for line in lines]
+        self.assertEqual(
+                expect, [False, True, True, True, True, True, True, False])
+        self.assertEqual(bbox.intersects_segments(lines), expect)
+        pairs = [(line.a.as_tuple(), line.b.as_tuple()) for line in lines]
+        self.assertEqual(bbox.intersects_segments(pairs), expect)
+        self.assertEqual(bbox.intersects_segments([]), [])
+
     def test_intersection_point(self):
         bbox = B(0, 0, 10, 5)
         f = bbox.intersection
@@ -1423,6 +1525,24 @@ class TestBoundingBox(GeomTestCase):
 
 
 class TestPolygon(GeomTestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Polygons are immutable, so the common test shapes are built once and
+        # shared between the tests.
+        cls.triangle = Pg([(1, 2), (3, 5), (4, 1), (1, 2)])
+        cls.octagon = Pg([
+                (1, 2),
+                (2, 1),
+                (2, -1),
+                (1, -2),
+                (-1, -2),
+                (-2, -1),
+                (-2, 1),
+                (-1, 2),
+                (1, 2),
+                ])
+        cls.horseshoe = Pg(HORSESHOE)
+
     def test_constructor(self):
         # not enough distinct points
         with self.assertRaises(ValueError):
@@ -1440,6 +1560,40 @@ class TestPolygon(GeomTestCase):
         poly = Pg([(1, 2), (3, 5), (4, 1), (1, 2)])
         self.assertEqual(len(poly), 4)
 
+    def test_constructor_large(self):
+        # Larger rings check for self-intersection with an edge tree, which
+        # should find the same first offending pair as checking every pair.
+        points = [
+                (math.cos(-π * i / 20), math.sin(-π * i / 20))
+                for i in range(40)]
+        points.append(points[0])
+        poly = Pg(points)
+        self.assertGreaterEqual(len(poly.lines), geom.INDEX_MIN_EDGES)
+
+        points[10] = (-2, 0)
+        with self.assertRaisesRegex(ValueError, "intersects with"):
+            Pg(points)
+
+        # A comb with long teeth, and the same comb with one tooth bent up
+        # to touch the next.
+        comb = []
+        for k in range(10):
+            y = 2 * k
+            comb.extend([(0, y), (10, y), (10, y + 1), (1, y + 1)])
+        comb.extend([(0, 20), (-1, 20), (-1, 0), (0, 0)])
+        self.assertEqual(len(Pg(comb)), len(comb))
+        comb[18] = (10, 10)
+        with self.assertRaisesRegex(ValueError, "intersects with"):
+            Pg(comb)
+
+        # Lines crossing the ring, touching a vertex, and fully inside or
+        # outside it.
+        f = poly.intersects
+        self.assertTrue(f(L((0, 0), (2, 0.1))))
+        self.assertTrue(f(L((1, 0), (2, 0))))
+        self.assertTrue(f(L((0, 0), (0.5, 0.5))))
+        self.assertFalse(f(L((1.5, 0), (2, 1))))
+
     def test_eq(self):
         a = Pg([(1, 2), (3, 5), (4, 1), (1, 2)])
         b = Pg([(1, 2), (3, 5), (4, 1), (1, 2)])
@@ -1448,68 +1602,64 @@ class TestPolygon(GeomTestCase):
         b = Pg([(1, 2), (3.1, 5), (4, 1), (1, 2)])
         self.assertNotEqual(a, b)
 
-        b = Pg([
-                (1, 1),
-                (1, 6),
-                (2, 5),
-                (2, 2),
-                (4, 2),
-                (3, 4),
-                (5, 4),
-                (4, 0),
-                (1, 1),
-                ])
+        b = self.horseshoe
         self.assertNotEqual(a, b)
 
         # Same ring of points, but starting from a different one.
         b = Pg([(4, 1), (1, 2), (3, 5), (4, 1)])
         self.assertEqual(a, b)
+        self.assertEqual(hash(a), hash(b))
+        self.assertEqual(len({a, b, Pg(a)}), 1)
+
+    def test_move(self):
+        poly = self.triangle.move(1, -2)
+        self.assertEqual(poly, Pg([(2, 0), (4, 3), (5, -1), (2, 0)]))
+        self.assertEqual(poly.area, self.triangle.area)
+        self.assertEqual(self.horseshoe.move(0.5, 0).move(-0.5, 0), self.horseshoe)
 
     def test_is_convex(self):
         # simple triangle
-        poly = Pg([(1, 2), (3, 5), (4, 1), (1, 2)])
+        poly = self.triangle
         self.assertTrue(poly.is_convex)
 
         # octagon centred on (0, 0)
-        poly = Pg([
-                (1, 2),
-                (2, 1),
-                (2, -1),
-                (1, -2),
-                (-1, -2),
-                (-2, -1),
-                (-2, 1),
-                (-1, 2),
-                (1, 2),
-                ])
+        poly = self.octagon
         self.assertTrue(poly.is_convex)
 
         # definitely non-convex
-        poly = Pg([
-                (1, 1),
-                (1, 6),
-                (2, 5),
-                (2, 2),
-                (4, 2),
-                (3, 4),
-                (5, 4),
-                (4, 0),
-                (1, 1),
-                ])
+        poly = self.horseshoe
         self.assertFalse(poly.is_convex)
 
+        # the module function agrees for Polygon instances
+        self.assertTrue(geom.is_convex(self.octagon))
+        self.assertFalse(geom.is_convex(self.horseshoe))
+
+        # reflex angle at the start point
+        poly = [(2, 2), (0, 4), (4, 4), (4, 0), (0, 0), (2, 2)]
+        self.assertFalse(geom.is_convex(poly))
+        self.assertFalse(Pg(poly).is_convex)
+        # an open sequence of points has no turn at the start to consider
+        self.assertTrue(geom.is_convex(poly[:-1]))
+
+    def test_signed_area(self):
+        f = geom.signed_area
+        # simple triangle, clockwise
+        poly = [(1, 2), (3, 5), (4, 1), (1, 2)]
+        self.assertAlmostEqual(f(poly), -5.5)
+        # same triangle, counter-clockwise
+        self.assertAlmostEqual(f(poly[::-1]), 5.5)
+        self.assertAlmostEqual(self.triangle.area, 5.5)
+
+        # horseshoe
+        poly = self.horseshoe
+        self.assertAlmostEqual(f(poly), -11)
+        self.assertAlmostEqual(poly.area, 11)
+        # repeated and copied, from the cached value
+        self.assertEqual(f(poly), f(list(HORSESHOE)))
+        self.assertEqual(Pg(poly).area, poly.area)
+
     def test_divide_polygon(self):
-        poly = [
-                (1, 1),
-                (1, 6),
-                (2, 5),
-                (2, 2),
-                (4, 2),
-                (3, 4),
-                (5, 4),
-                (4, 0),
-                (1, 1),
-                ]
+        poly = list(HORSESHOE)
         with self.assertRaises(ValueError):
             geom.divide_polygon(poly, 0, 0)
         with self.assertRaises(ValueError):
@@ -1541,6 +1691,18 @@ class TestPolygon(GeomTestCase):
                     [(4, 2), (3, 4), (5, 4), (4, 0), (4, 2)],
                     [(1, 1), (1, 6), (2, 5), (2, 2), (4, 2), (4, 0), (1, 1)],
                     ))
+        # Any sequence of points will do, and the results are always lists
+        self.assertEqual(
+                geom.divide_polygon(tuple(poly), 0, 3),
+                geom.divide_polygon(poly, 0, 3))
+
+        # A Polygon's halves share its Points
+        polygon = self.horseshoe
+        a, b = geom.divide_polygon(polygon, 0, 3)
+        self.assertIs(a[1], polygon[1])
+        self.assertEqual(
+                (Pg(a), Pg(b)),
+                tuple(Pg(x) for x in geom.divide_polygon(poly, 0, 3)))
 
     def test_shift_polygon(self):
         # simple triangle
@@ -1553,10 +1715,141 @@ class TestPolygon(GeomTestCase):
         self.assertEqual(geom.shift_polygon(poly, 2), shift2)
         self.assertEqual(geom.shift_polygon(poly, 3), poly)
         self.assertEqual(geom.shift_polygon(poly, 4), shift1)
+        self.assertEqual(geom.shift_polygon(tuple(poly), 1), tuple(shift1))
+
+        # A Polygon gives its own Points, which can make a new Polygon
+        poly = self.triangle
+        shifted = geom.shift_polygon(poly, 1)
+        self.assertIs(shifted[0], poly[1])
+        self.assertEqual(Pg(shifted), poly)
+
+    def test_point_in_polygon(self):
+        # horseshoe
+        poly = list(HORSESHOE)
+        f = geom.point_in_polygon
+        self.assertTrue(f(poly, (2, 1)))
+        self.assertTrue(f(poly, (4, 3)))
+        self.assertFalse(f(poly, (3, 3)))
+        self.assertFalse(f(poly, (0, 1)))
+        self.assertFalse(f(poly, (6, 1)))
+
+        # boundary
+        self.assertTrue(f(poly, (1, 3)))
+        self.assertFalse(f(poly, (1, 3), exact=False))
+        self.assertTrue(f(poly, (4, 0)))
+        self.assertFalse(f(poly, (4, 0), exact=False))
+        self.assertFalse(f(poly, (3, 2), exact=False))
+
+        # A self-intersecting pentagram winds twice around its centre, which
+        # is still inside.
+        star = [
+                (math.sin(4 * π * i / 5), math.cos(4 * π * i / 5))
+                for i in range(6)]
+        self.assertTrue(f(star, (0, 0)))
+        self.assertTrue(f(star, (0, 0.6)))
+        self.assertFalse(f(star, (0, -0.9)))
+
+        # Polygon instances give the same results
+        poly = self.horseshoe
+        self.assertTrue(f(poly, (2, 1)))
+        self.assertFalse(f(poly, (3, 3)))
+        self.assertTrue(f(poly, (1, 3)))
+        self.assertFalse(f(poly, (1, 3), exact=False))
+
+        # Including large ones, which look up their edges in an index
+        poly = geom.regular_polygon(P(0, 0), 40, radius=5)
+        self.assertTrue(f(poly, (0, 0)))
+        self.assertTrue(f(poly, (0, 5)))
+        self.assertFalse(f(poly, (0, 5), exact=False))
+        self.assertFalse(f(poly, (0, 5.1)))
+        self.assertFalse(f(poly, (4, 4)))
+
+    def test_points_in_polygon(self):
+        f = geom.points_in_polygon
+        expect = [value for row in HORSESHOE_CONTAINS for value in row]
+        points = grid_points(HORSESHOE_CONTAINS)
+        self.assertEqual(f(list(HORSESHOE), points, exact=False), expect)
+        self.assertEqual(f(self.horseshoe, points, exact=False), expect)
+        self.assertEqual(f(self.horseshoe, []), [])
+
+        # Boundary points take the value of 'exact', as for point_in_polygon.
+        points = [(x / 2, y / 2) for y in range(-2, 15) for x in range(-2, 13)]
+        for exact in (True, False):
+            expect = [
+                    geom.point_in_polygon(HORSESHOE, p, exact)
+                    for p in points]
+            self.assertEqual(f(HORSESHOE, points, exact), expect)
+
+        # A large ring given as a plain sequence is indexed partway through
+        # the batch, without changing any of the answers.
+        ring = list(geom.regular_polygon(P(0, 0), 40, radius=5).points)
+        points = [(x / 2, y / 2) for y in range(-12, 13) for x in range(-12, 13)]
+        expect = [geom.point_in_polygon(ring, p) for p in points]
+        self.assertEqual(f(ring, points), expect)
+
+        # Points within ABS_TOL of an edge are on the boundary, so not
+        # contained, as for Polygon.contains_point.
+        square = Pg([(0, 0), (0, 10), (10, 10), (10, 0), (0, 0)])
+        diamond = Pg([(4999, 1000), (5000, 0), (4999, -1000), (4999, 1000)])
+        points = [
+                (9.999, 1e-9), (0.001, -1e-9), (5, 10 - 1e-9), (1e-9, 5),
+                (10 + 1e-9, 5), (5, 5), (5000 - 2e-6, 0), (4999.5, 0)]
+        for poly in (square, diamond, self.triangle, self.horseshoe):
+            expect = [poly.contains_point(p) for p in points]
+            with self.subTest(poly=poly):
+                self.assertEqual(f(poly, points, exact=False), expect)
+                self.assertEqual(f(list(poly), points, exact=False), expect)
+                self.assertEqual(
+                        [
+                            geom.point_in_polygon(poly, p, exact=False)
+                            for p in points],
+                        expect)
+        self.assertEqual(
+                f(square, points[:6], exact=False),
+                [False, False, False, False, False, True])
+
+    def test_points_in_grid(self):
+        f = geom.points_in_grid
+        expect = [list(row) for row in HORSESHOE_CONTAINS]
+        xs = range(len(expect[0]))
+        ys = range(len(expect))
+        self.assertEqual(f(list(HORSESHOE), xs, ys, exact=False), expect)
+        self.assertEqual(f(self.horseshoe, xs, ys, exact=False), expect)
+        self.assertEqual(f(self.horseshoe, xs, []), [])
+        self.assertEqual(f(self.horseshoe, [], ys), [[]] * len(ys))
+
+        # Same answers as points_in_polygon, including boundary points, on a
+        # grid offset from the polygon's vertices as well as through them.
+        poly = geom.regular_polygon(P(0, 0), 24, radius=5)
+        xs = [x / 3 - 0.01 for x in range(-18, 19)] + [0, 5]
+        ys = [y / 3 for y in range(-18, 19)] + [5]
+        for target in (HORSESHOE, poly):
+            for exact in (True, False):
+                with self.subTest(target=target, exact=exact):
+                    self.assertEqual(
+                            f(target, xs, ys, exact),
+                            [
+                                geom.points_in_polygon(
+                                    target, [(x, y) for x in xs], exact)
+                                for y in ys])
+
+        # Including near an extreme vertex, where the bounding box rejects
+        # points that the edges don't.
+        diamond = Pg([(4999, 1000), (5000, 0), (4999, -1000), (4999, 1000)])
+        xs = [4999.5, 5000 - 2e-6, 5000]
+        ys = [-1e-9, 0, 1e-9, 999.9]
+        self.assertEqual(
+                f(diamond, xs, ys, exact=False),
+                [
+                    geom.points_in_polygon(
+                        diamond, [(x, y) for x in xs], exact=False)
+                    for y in ys])
+        self.assertEqual(
+                f(diamond, xs, [0], exact=False), [[True, False, False]])
 
     def test_contains_point(self):
         # simple triangle
-        poly = Pg([(1, 2), (3, 5), (4, 1), (1, 2)])
+        poly = self.triangle
         f = poly.contains_point
         expect = (
                 (False, False, False, False, False),
@@ -1566,22 +1859,13 @@ class TestPolygon(GeomTestCase):
                 (False, False, False,  True, False),
                 (False, False, False, False, False),
                 )
-        for y in range(len(expect)):
-            for x in range(len(expect[y])):
-                self.assertIs(f(P(x, y)), expect[y][x], f"({x}, {y})")
+        for y, row in enumerate(expect):
+            for x, value in enumerate(row):
+                with self.subTest(x=x, y=y):
+                    self.assertIs(f(P(x, y)), value)
 
         # octagon centred on (0, 0)
-        poly = Pg([
-                (1, 2),
-                (2, 1),
-                (2, -1),
-                (1, -2),
-                (-1, -2),
-                (-2, -1),
-                (-2, 1),
-                (-1, 2),
-                (1, 2),
-                ])
+        poly = self.octagon
         f = poly.contains_point
         self.assertTrue(f(P(1, 1)))
         self.assertTrue(f(P(1, -1)))
@@ -1589,35 +1873,118 @@ class TestPolygon(GeomTestCase):
         self.assertTrue(f(P(-1, 1)))
         self.assertFalse(f(P(2, 2)))
 
+        # A point within tolerance of an edge is on the boundary, and so not
+        # contained, even right by the edge's start.
+        poly = Pg([(0, 0), (0, 10), (10, 0), (0, 0)])
+        p = P(0.001, 9.999 - 2e-9)
+        self.assertTrue(L((0, 10), (10, 0)).intersects(p))
+        self.assertTrue(p.touches(poly))
+        self.assertFalse(poly.contains_point(p))
+        self.assertFalse(p.within(poly))
+        self.assertTrue(poly.intersects(p))
+
         # horseshoe
-        poly = Pg([
-                (1, 1),
-                (1, 6),
-                (2, 5),
-                (2, 2),
-                (4, 2),
-                (3, 4),
-                (5, 4),
-                (4, 0),
-                (1, 1),
-                ])
+        poly = self.horseshoe
         f = poly.contains_point
-        expect = (
-                (False, False, False, False, False, False, False),
-                (False, False,  True,  True,  True, False, False),
-                (False, False, False, False, False, False, False),
-                (False, False, False, False,  True, False, False),
-                (False, False, False, False, False, False, False),
-                (False, False, False, False, False, False, False),
-                (False, False, False, False, False, False, False),
-                )
-        for y in range(len(expect)):
-            for x in range(len(expect[y])):
-                self.assertIs(f(P(x, y)), expect[y][x], f"({x}, {y})")
+        expect = HORSESHOE_CONTAINS
+        for y, row in enumerate(expect):
+            for x, value in enumerate(row):
+                with self.subTest(x=x, y=y):
+                    self.assertIs(f(P(x, y)), value)
+
+    def test_contains_point_convex(self):
+        # Convex polygons take a different path, it should agree with the
+        # general ray cast, including for points on the boundary.
+        g = geom.point_in_polygon
+        for sides in (3, 4, 5, 8, 30):
+            poly = geom.regular_polygon(P(0, 0), sides, radius=4)
+            f = poly.contains_point
+            for y in range(-10, 11):
+                for x in range(-10, 11):
+                    p = (x / 2, y / 2)
+                    self.assertIs(
+                            f(p), g(poly, p, exact=False),
+                            f"{sides} sides, {p}")
+
+        # Reflex angle at the start point, so not convex
+        poly = Pg([(2, 2), (0, 4), (4, 4), (4, 0), (0, 0), (2, 2)])
+        self.assertFalse(poly.contains_point(P(1, 2)))
+        self.assertTrue(poly.contains_point(P(3, 2)))
+
+    def test_contains_point_indexed(self):
+        # Polygons with many edges look up the edges to test by height, which
+        # should agree with testing every edge, including on the boundary.
+        points = []
+        for i in range(24):
+            angle = -π * i / 12
+            radius = 4 if i % 2 else 2
+            points.append((radius * math.cos(angle), radius * math.sin(angle)))
+        points.append(points[0])
+        poly = Pg(points)
+        self.assertGreaterEqual(len(poly.lines), geom.INDEX_MIN_EDGES)
+        grid = [(x / 4, y / 4) for y in range(-18, 19) for x in range(-18, 19)]
+        grid.extend(poly.points)
+        for exact in (True, False):
+            expect = [geom.point_in_polygon(points, p, exact) for p in grid]
+            self.assertEqual(geom.points_in_polygon(poly, grid, exact), expect)
+        expect = [geom.point_in_polygon(points, p, False) for p in grid]
+        self.assertEqual(poly.contains_points(grid), expect)
+        expect = [geom.point_in_polygon(points, p, True) for p in grid]
+        self.assertEqual([poly.intersects(P(p)) for p in grid], expect)
+
+    def test_contains_points(self):
+        # simple triangle
+        poly = self.triangle
+        points = [(x, y) for y in range(6) for x in range(5)]
+        expect = [poly.contains_point(p) for p in points]
+        self.assertEqual(poly.contains_points(points), expect)
+        self.assertEqual(poly.contains_points([]), [])
+        self.assertEqual(
+                poly.contains_points([P(3, 3), P(1, 2), P(10, 10)]),
+                [True, False, False])
+
+        # horseshoe
+        poly = self.horseshoe
+        expect = HORSESHOE_CONTAINS
+        self.assertEqual(
+                poly.contains_points(grid_points(expect)),
+                [value for row in expect for value in row])
+
+        # Rows of points, in any order, with some on the boundary
+        points = [(x / 2, y / 2) for x in range(14) for y in range(14)]
+        points.extend(poly.points)
+        expect = [poly.contains_point(p) for p in points]
+        self.assertEqual(poly.contains_points(points), expect)
+        self.assertEqual(poly.contains_points(points[::-1]), expect[::-1])
+
+        # Points within tolerance of an edge, or of the bounding box
+        square = Pg([(0, 0), (0, 10), (10, 10), (10, 0), (0, 0)])
+        for poly, points in (
+                (square, [(9.999, 1e-9), (5, 10 - 1e-9), (1e-9, 5), (5, 5)]),
+                (self.triangle, [(2, 3.5 + 1e-9), (2.5, 1.5 + 1e-9), (3, 3)]),
+                (
+                    Pg([(0, 0), (0, 10), (10, 0), (0, 0)]),
+                    [(0.001, 1e-9), (0.001, 9.999 - 2e-9), (1, 1)]),
+                (self.horseshoe, [(1 + 1e-9, 2), (4, 1e-9), (2, 1)]),
+                (
+                    # Within tolerance of the bounding box, but not of any
+                    # edge, at a magnitude where float_close's relative
+                    # tolerance is the wider.
+                    Pg([(4999, 1000), (5000, 0), (4999, -1000), (4999, 1000)]),
+                    [(5000 - 2e-6, 0), (4999.5, 0)]),
+                (
+                    Pg([
+                        (4999, 1000), (5000, 0), (4999, -1000), (4999.5, 0),
+                        (4999, 1000)]),
+                    [(5000 - 2e-6, 0), (4999.8, 0)])):
+            expect = [poly.contains_point(p) for p in points]
+            with self.subTest(poly=poly):
+                self.assertEqual(expect[:-1], [False] * (len(points) - 1))
+                self.assertEqual(poly.contains_points(points), expect)
 
     def test_contains_line(self):
         # simple triangle
-        poly = Pg([(1, 2), (3, 5), (4, 1), (1, 2)])
+        poly = self.triangle
         f = poly.contains_line
 
         # Fully external
@@ -1634,17 +2001,7 @@ class TestPolygon(GeomTestCase):
         self.assertFalse(f(L((3.5, 3), (4.5, -1))))
 
         # horseshoe
-        poly = Pg([
-                (1, 1),
-                (1, 6),
-                (2, 5),
-                (2, 2),
-                (4, 2),
-                (3, 4),
-                (5, 4),
-                (4, 0),
-                (1, 1),
-                ])
+        poly = self.horseshoe
         f = poly.contains_line
 
         # Fully external
@@ -1664,7 +2021,7 @@ class TestPolygon(GeomTestCase):
 
     def test_contains_bbox(self):
         # simple triangle
-        poly = Pg([(1, 2), (3, 5), (4, 1), (1, 2)])
+        poly = self.triangle
         f = poly.contains_bbox
         # Fully internal
         self.assertTrue(f(B(2, 2, 3, 3)))
@@ -1676,40 +2033,20 @@ class TestPolygon(GeomTestCase):
         self.assertTrue(f(B(2, 2, 3.5, 3)))
 
         # octagon centred on (0, 0)
-        poly = Pg([
-                (1, 2),
-                (2, 1),
-                (2, -1),
-                (1, -2),
-                (-1, -2),
-                (-2, -1),
-                (-2, 1),
-                (-1, 2),
-                (1, 2),
-                ])
+        poly = self.octagon
         f = poly.contains_bbox
         # Sharing entire boundary lines
         self.assertTrue(f(B(-2, -1, 2, 1)))
         self.assertFalse(f(B(-1, 2, 1, 4)))
 
         # horseshoe
-        poly = Pg([
-                (1, 1),
-                (1, 6),
-                (2, 5),
-                (2, 2),
-                (4, 2),
-                (3, 4),
-                (5, 4),
-                (4, 0),
-                (1, 1),
-                ])
+        poly = self.horseshoe
         f = poly.contains_bbox
         self.assertTrue(f(B(2, 1, 4, 1.5)))
 
     def test_contains_poly(self):
         # Simple triangle
-        a = Pg([(1, 2), (3, 5), (4, 1), (1, 2)])
+        a = self.triangle
         f = a.contains_polygon
         # Fully internal
         b = Pg([(2, 2), (3, 4), (3, 2), (2, 2)])
@@ -1724,17 +2061,7 @@ class TestPolygon(GeomTestCase):
         self.assertTrue(f(Pg([(3.5, 3), (2, 2), (3, 4), (3.5, 3)])))
 
         # Octagon centred on (0, 0)
-        a = Pg([
-                (1, 2),
-                (2, 1),
-                (2, -1),
-                (1, -2),
-                (-1, -2),
-                (-2, -1),
-                (-2, 1),
-                (-1, 2),
-                (1, 2),
-                ])
+        a = self.octagon
         f = a.contains_polygon
         # Sharing entire boundary lines
         b = Pg([
@@ -1752,17 +2079,7 @@ class TestPolygon(GeomTestCase):
         self.assertFalse(f(b))
 
         # Horseshoe
-        a = Pg([
-                (1, 1),
-                (1, 6),
-                (2, 5),
-                (2, 2),
-                (4, 2),
-                (3, 4),
-                (5, 4),
-                (4, 0),
-                (1, 1),
-                ])
+        a = self.horseshoe
         f = a.contains_polygon
         b = Pg([
             (1, 1),
@@ -1775,17 +2092,7 @@ class TestPolygon(GeomTestCase):
 
     def test_intersects_point(self):
         # horseshoe
-        poly = Pg([
-                (1, 1),
-                (1, 6),
-                (2, 5),
-                (2, 2),
-                (4, 2),
-                (3, 4),
-                (5, 4),
-                (4, 0),
-                (1, 1),
-                ])
+        poly = self.horseshoe
         f = poly.intersects
         expect = (
                 (False, False, False, False,  True, False, False),
@@ -1796,13 +2103,14 @@ class TestPolygon(GeomTestCase):
                 (False,  True,  True, False, False, False, False),
                 (False,  True, False, False, False, False, False),
                 )
-        for y in range(len(expect)):
-            for x in range(len(expect[y])):
-                self.assertIs(f(P(x, y)), expect[y][x], f"({x}, {y})")
+        for y, row in enumerate(expect):
+            for x, value in enumerate(row):
+                with self.subTest(x=x, y=y):
+                    self.assertIs(f(P(x, y)), value)
 
     def test_intersects_line(self):
         # simple triangle
-        poly = Pg([(1, 2), (3, 5), (4, 1), (1, 2)])
+        poly = self.triangle
         f = poly.intersects
 
         # Fully external
@@ -1819,17 +2127,7 @@ class TestPolygon(GeomTestCase):
         self.assertTrue(f(L((3.5, 3), (4.5, -1))))
 
         # horseshoe
-        poly = Pg([
-                (1, 1),
-                (1, 6),
-                (2, 5),
-                (2, 2),
-                (4, 2),
-                (3, 4),
-                (5, 4),
-                (4, 0),
-                (1, 1),
-                ])
+        poly = self.horseshoe
         f = poly.intersects
 
         # Fully external
@@ -1849,7 +2147,7 @@ class TestPolygon(GeomTestCase):
 
     def test_intersects_bbox(self):
         # simple triangle
-        poly = Pg([(1, 2), (3, 5), (4, 1), (1, 2)])
+        poly = self.triangle
         f = poly.intersects
         # Fully internal
         self.assertTrue(f(B(2, 2, 3, 3)))
@@ -1861,40 +2159,37 @@ class TestPolygon(GeomTestCase):
         self.assertTrue(f(B(2, 2, 3.5, 3)))
 
         # octagon centred on (0, 0)
-        poly = Pg([
-                (1, 2),
-                (2, 1),
-                (2, -1),
-                (1, -2),
-                (-1, -2),
-                (-2, -1),
-                (-2, 1),
-                (-1, 2),
-                (1, 2),
-                ])
+        poly = self.octagon
         f = poly.intersects
         # Sharing entire boundary lines
         self.assertTrue(f(B(-2, -1, 2, 1)))
         self.assertTrue(f(B(-1, 2, 1, 4)))
 
         # horseshoe
-        poly = Pg([
-                (1, 1),
-                (1, 6),
-                (2, 5),
-                (2, 2),
-                (4, 2),
-                (3, 4),
-                (5, 4),
-                (4, 0),
-                (1, 1),
-                ])
+        poly = self.horseshoe
         f = poly.intersects
         self.assertTrue(f(B(2, 1, 4, 1.5)))
 
+    def test_bbox_shortcuts(self):
+        # Calling the particular methods directly gives the same answers as
+        # the general ones, for geometries well away from the polygon and for
+        # those just touching its bounding box.
+        poly = self.horseshoe
+        for dx in (20, 4):
+            line = L((1 + dx, 0), (1 + dx, 6))
+            bbox = B(1 + dx, 0, 2 + dx, 6)
+            other = poly.move(dx, 0)
+            self.assertIs(poly.intersects_line(line), poly.intersects(line))
+            self.assertIs(poly.intersects_bbox(bbox), poly.intersects(bbox))
+            self.assertIs(poly.covers_bbox(bbox), poly.covers(bbox))
+            self.assertIs(
+                    poly.intersects_polygon(other), poly.intersects(other))
+        self.assertFalse(poly.intersects_polygon(poly.move(20, 0)))
+        self.assertTrue(poly.intersects_polygon(poly.move(4, 0)))
+
     def test_intersects_poly(self):
         # Simple triangle
-        a = Pg([(1, 2), (3, 5), (4, 1), (1, 2)])
+        a = self.triangle
         f = a.intersects
         # Fully internal
         b = Pg([(2, 2), (3, 4), (3, 2), (2, 2)])
@@ -1909,17 +2204,7 @@ class TestPolygon(GeomTestCase):
         self.assertTrue(f(Pg([(3.5, 3), (2, 2), (3, 4), (3.5, 3)])))
 
         # Octagon centred on (0, 0)
-        a = Pg([
-                (1, 2),
-                (2, 1),
-                (2, -1),
-                (1, -2),
-                (-1, -2),
-                (-2, -1),
-                (-2, 1),
-                (-1, 2),
-                (1, 2),
-                ])
+        a = self.octagon
         f = a.intersects
         # Sharing entire boundary lines
         b = Pg([
@@ -1936,18 +2221,19 @@ class TestPolygon(GeomTestCase):
         b = b.move(4, 0)
         self.assertTrue(f(b))
 
+        # Convex pairs whose bounding boxes overlap
+        a = Pg([(0, 0), (0, 2), (2, 0)])
+        f = a.intersects
+        # Apart across the diagonal
+        self.assertFalse(f(Pg([(1.5, 1.5), (1.5, 3), (3, 1.5)])))
+        # Point contact across the diagonal
+        self.assertTrue(f(Pg([(1, 1), (1, 3), (3, 1)])))
+        # Crossing bars, with no vertex of either inside the other
+        a = Pg([(0, 1), (0, 2), (3, 2), (3, 1)])
+        self.assertTrue(a.intersects(Pg([(1, 0), (1, 3), (2, 3), (2, 0)])))
+
         # Horseshoe
-        a = Pg([
-                (1, 1),
-                (1, 6),
-                (2, 5),
-                (2, 2),
-                (4, 2),
-                (3, 4),
-                (5, 4),
-                (4, 0),
-                (1, 1),
-                ])
+        a = self.horseshoe
         f = a.intersects
         b = Pg([
             (1, 1),
@@ -1960,7 +2246,7 @@ class TestPolygon(GeomTestCase):
 
     def test_intersection_line(self):
         # Simple triangle
-        a = Pg([(1, 2), (3, 5), (4, 1), (1, 2)])
+        a = self.triangle
         f = a.intersection
 
         self.assertIsNone(f(L((0, 0), (1, 0))))
@@ -2044,6 +2330,13 @@ class TestPolygon(GeomTestCase):
         b = Pg([(4, 0), (1, 3), (4, 3), (4, 0)])
         self.assertIsNone(f(b))
 
+        # B is well away from A, with no overlap between their bounding boxes
+        b = b.move(10, 10)
+        self.assertIsNone(f(b))
+        self.assertIsNone(a.intersection_polygon(b))
+        self.assertFalse(a.covers(b))
+        self.assertFalse(a.contains_polygon(b))
+
         # B shares only a boundary with A
         b = Pg([(3, 0), (0, 3), (3, 3), (3, 0)])
         self.assertEqual(f(b), L((0, 3), (3, 0)))
@@ -2076,7 +2369,7 @@ class TestPolygon(GeomTestCase):
 
     def test_crop_line(self):
         # Simple triangle
-        a = Pg([(1, 2), (3, 5), (4, 1), (1, 2)])
+        a = self.triangle
         f = a.crop_line
 
         self.assertIsNone(f(L((0, 0), (1, 0))))
@@ -2166,7 +2459,7 @@ class TestPolygon(GeomTestCase):
     def test_union(self):
         f = geom.union
         # Simple triangle
-        a = Pg([(1, 2), (3, 5), (4, 1), (1, 2)])
+        a = self.triangle
 
         # Union with a point inside, or on the boundary, should return just the
         # polygon itself.
@@ -2344,6 +2637,62 @@ class TestRegularPolygon(GeomTestCase):
             line = -(a.lines[i])
             self.assertAlmostEqual(line.relative_angle(a.lines[(i+1) % n]), angle)
 
+    def test_symmetry(self):
+        for n in (5, 6, 7, 8, 12, 100):
+            with self.subTest(n=n):
+                a = geom.regular_polygon(P(0, 0), n, radius=2)
+                xy = [(p.x, p.y) for p in a[:-1]]
+                self.assertEqual(len(xy), n)
+                # Exactly symmetric about the vertical axis
+                for i in range(1, n):
+                    self.assertEqual(xy[n - i], (-xy[i][0], xy[i][1]))
+                # Vertices on the axes lie exactly on them
+                if n % 2 == 0:
+                    self.assertEqual(xy[n // 2], (0, -2))
+                if n % 4 == 0:
+                    self.assertEqual(xy[n // 4], (2, 0))
+
+        a = geom.regular_polygon(P(0, 0), 8, radius=2)
+        self.assertEqual(a[1].x, a[1].y)
+
+
+class TestPolygonIndex(GeomTestCase):
+    def test_query(self):
+        square = [(0, 0), (0, 2), (2, 2), (2, 0), (0, 0)]
+        polys = [
+                Pg(square),
+                [(x + 1, y + 1) for x, y in square],
+                HORSESHOE,
+                geom.regular_polygon(P(10, 10), 6, radius=1),
+                ]
+        index = geom.PolygonIndex(polys)
+        self.assertEqual(len(index), 4)
+        self.assertIsInstance(index.polygons[1], Pg)
+
+        f = index.query
+        self.assertEqual(f((0.5, 0.5)), [0])
+        self.assertEqual(f((1.5, 1.5)), [0, 1, 2])
+        self.assertEqual(f(P(10, 10)), [3])
+        self.assertEqual(f((7, 7)), [])
+        # boundary
+        self.assertEqual(f((0, 2)), [0])
+        self.assertEqual(f((0, 2), exact=False), [])
+
+        # Many polygons agree with testing each one in turn
+        polys = [
+                geom.regular_polygon(P(x, y), 3 + (x + y) % 5, radius=0.8)
+                for x in range(10) for y in range(10)]
+        index = geom.PolygonIndex(polys)
+        for y in range(-2, 22):
+            for x in range(-2, 22):
+                p = (x / 2, y / 2)
+                expect = [
+                        i for i, poly in enumerate(polys)
+                        if geom.point_in_polygon(poly, p)]
+                self.assertEqual(index.query(p), expect, p)
+
+        self.assertEqual(geom.PolygonIndex([]).query((0, 0)), [])
+
 
 class TestCollection(unittest.TestCase):
     def test_make(self):
@@ -2357,3 +2706,8 @@ class TestCollection(unittest.TestCase):
         self.assertIn(b, coll)
         self.assertIn(c, coll)
         self.assertEqual(len(coll), 3)
+
+        # Nested collections are flattened
+        coll = geom.Collection.make([a, geom.MultiPoint([b, c])])
+        self.assertIsInstance(coll, geom.MultiPoint)
+        self.assertEqual(coll, geom.MultiPoint([a, b, c]))